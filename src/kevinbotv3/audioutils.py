@@ -11,19 +11,29 @@ class ShutupPyAudioCtxMgr:
       https://stackoverflow.com/a/67962563, https://stackoverflow.com/questions/11130156/
     """
 
-    def __init__(self):
-        # Open a pair of null files
-        self.null_fds = [os.open(os.devnull, os.O_RDWR) for _ in range(2)]
+    _null_fds: tuple[int, int] | None = None
 
-        # Save the actual stdout (1) and stderr (2) file descriptors.
-        self.save_fds = [os.dup(1), os.dup(2)]
+    def __init__(self):
+        self.save_fds: list[int] = []
 
         self.pyaudio = None
 
+    @classmethod
+    def _get_null_fds(cls) -> tuple[int, int]:
+        # Open a pair of null files once and share them for the life of the process
+        if cls._null_fds is None:
+            cls._null_fds = (os.open(os.devnull, os.O_RDWR), os.open(os.devnull, os.O_RDWR))
+        return cls._null_fds
+
     def __enter__(self) -> PyAudio:
+        null_fds = self._get_null_fds()
+
+        # Save the actual stdout (1) and stderr (2) file descriptors.
+        self.save_fds = [os.dup(1), os.dup(2)]
+
         # Assign the null pointers to stdout and stderr.
-        os.dup2(self.null_fds[0], 1)
-        os.dup2(self.null_fds[1], 2)
+        os.dup2(null_fds[0], 1)
+        os.dup2(null_fds[1], 2)
 
         self.pyaudio = PyAudio()
 
@@ -37,6 +47,7 @@ class ShutupPyAudioCtxMgr:
         os.dup2(self.save_fds[0], 1)
         os.dup2(self.save_fds[1], 2)
 
-        # Close all file descriptors
-        for fd in self.null_fds + self.save_fds:
+        # Close the saved file descriptors; the shared null files stay open
+        for fd in self.save_fds:
             os.close(fd)
+        self.save_fds = []
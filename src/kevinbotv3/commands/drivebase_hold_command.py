@@ -3,17 +3,22 @@ from kevinbotlib.scheduler import Command
 
 from kevinbotv3.core import KevinbotDrivebase
 
+_LOG = Logger()
+
 
 class DrivebaseHoldCommand(Command):
+    __slots__ = ("_log_message", "drivebase", "hold")
+
     def __init__(self, drivebase: KevinbotDrivebase, hold: bool) -> None:  # noqa: FBT001
         super().__init__()
 
         self.drivebase = drivebase
         self.hold = hold
+        self._log_message = f"Set drivebase hold: {hold}"
 
     def init(self) -> None:
         super().init()
-        Logger().debug(f"Set drivebase hold: {self.hold}")
+        _LOG.debug(self._log_message)
         self.drivebase.set_hold(self.hold)
 
     def execute(self) -> None:
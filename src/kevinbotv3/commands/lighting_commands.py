@@ -6,21 +6,23 @@ from kevinbotlib.scheduler import Command
 from kevinbotv3.core import KevinbotLighting, LightingEffect, LightingZone
 from kevinbotv3.runtime import Runtime
 
+_LOG = Logger()
+
+
+class _LightingCommand(Command):
+    """Shared base for the one-shot lighting commands; subclasses only implement init()"""
+
+    __slots__ = ("_log_message", "lighting", "zone")
+
+    # debug message logged on init; formatted once per instance since zone is fixed
+    _log_template = ""
 
-class OffCommand(Command):
     def __init__(self, lighting: KevinbotLighting, zone: LightingZone) -> None:
         super().__init__()
 
         self.lighting = lighting
         self.zone = zone
-
-    def init(self) -> None:
-        super().init()
-        Logger().debug(f"Set lighting zone {self.zone} to off")
-        Runtime.Leds.effect = "off"
-
-        self.lighting.set_effect(self.zone, LightingEffect.color1)
-        self.lighting.set_color1(self.zone, (0, 0, 0))
+        self._log_message = self._log_template.format(zone)
 
     def execute(self) -> None:
         return super().execute()
@@ -32,95 +34,79 @@ class OffCommand(Command):
         return True
 
 
-class WhiteCommand(Command):
+class _BrightnessLightingCommand(_LightingCommand):
+    __slots__ = ("brightness",)
+
     def __init__(self, lighting: KevinbotLighting, zone: LightingZone, brightness: Callable[[], int]) -> None:
-        super().__init__()
+        super().__init__(lighting, zone)
 
-        self.lighting = lighting
-        self.zone = zone
         self.brightness = brightness
 
+
+class OffCommand(_LightingCommand):
+    __slots__ = ()
+
+    _log_template = "Set lighting zone {} to off"
+
     def init(self) -> None:
         super().init()
-        Logger().debug(f"Set lighting zone {self.zone} to white")
-        Runtime.Leds.effect = "white"
+        _LOG.debug(self._log_message)
+        Runtime.Leds.effect = "off"
 
         self.lighting.set_effect(self.zone, LightingEffect.color1)
-        Runtime.Leds.true_effect = LightingEffect.color1
-        self.lighting.set_color1(self.zone, (self.brightness(),) * 3)
-        Runtime.Leds.color1 = (self.brightness(),) * 3
+        self.lighting.set_color1(self.zone, (0, 0, 0))
 
-    def execute(self) -> None:
-        return super().execute()
 
-    def end(self) -> None:
-        return super().end()
+class WhiteCommand(_BrightnessLightingCommand):
+    __slots__ = ()
 
-    def finished(self) -> bool:
-        return True
+    _log_template = "Set lighting zone {} to white"
 
+    def init(self) -> None:
+        super().init()
+        _LOG.debug(self._log_message)
+        Runtime.Leds.effect = "white"
 
-class FireCommand(Command):
-    def __init__(self, lighting: KevinbotLighting, zone: LightingZone, brightness: Callable[[], int]) -> None:
-        super().__init__()
+        self.lighting.set_effect(self.zone, LightingEffect.color1)
+        Runtime.Leds.true_effect = LightingEffect.color1
+        brightness = max(0, min(255, self.brightness()))
+        color = (brightness, brightness, brightness)
+        self.lighting.set_color1(self.zone, color)
+        Runtime.Leds.color1 = color
 
-        self.lighting = lighting
-        self.zone = zone
-        self.brightness = brightness
+
+class FireCommand(_BrightnessLightingCommand):
+    __slots__ = ()
+
+    _log_template = "Set lighting zone {} to fire"
 
     def init(self) -> None:
         super().init()
-        Logger().debug(f"Set lighting zone {self.zone} to fire")
+        _LOG.debug(self._log_message)
         Runtime.Leds.effect = "fire"
 
         self.lighting.set_effect(self.zone, LightingEffect.fire)
         Runtime.Leds.true_effect = LightingEffect.fire
         self.lighting.set_brightness(self.zone, self.brightness())
 
-    def execute(self) -> None:
-        return super().execute()
-
-    def end(self) -> None:
-        return super().end()
-
-    def finished(self) -> bool:
-        return True
 
+class RainbowCommand(_BrightnessLightingCommand):
+    __slots__ = ()
 
-class RainbowCommand(Command):
-    def __init__(self, lighting: KevinbotLighting, zone: LightingZone, brightness: Callable[[], int]) -> None:
-        super().__init__()
-
-        self.lighting = lighting
-        self.zone = zone
-        self.brightness = brightness
+    _log_template = "Set lighting zone {} to rainbow"
 
     def init(self) -> None:
         super().init()
-        Logger().debug(f"Set lighting zone {self.zone} to rainbow")
+        _LOG.debug(self._log_message)
         Runtime.Leds.effect = "rainbow"
 
         self.lighting.set_effect(self.zone, LightingEffect.rainbow)
         Runtime.Leds.true_effect = LightingEffect.rainbow
         self.lighting.set_brightness(self.zone, self.brightness())
 
-    def execute(self) -> None:
-        return super().execute()
-
-    def end(self) -> None:
-        return super().end()
-
-    def finished(self) -> bool:
-        return True
-
 
-class SpeechLightingCommand(Command):
-    def __init__(self, lighting: KevinbotLighting, zone: LightingZone, brightness: Callable[[], int]) -> None:
-        super().__init__()
-
-        self.lighting = lighting
-        self.zone = zone
-        self.brightness = brightness
+class SpeechLightingCommand(_BrightnessLightingCommand):
+    __slots__ = ()
 
     def init(self) -> None:
         super().init()
@@ -129,9 +115,6 @@ class SpeechLightingCommand(Command):
         self.lighting.set_color2(self.zone, (0, 0, 0))
         self.lighting.set_brightness(self.zone, self.brightness())
 
-    def execute(self) -> None:
-        return super().execute()
-
     def end(self) -> None:
         self.lighting.set_effect(self.zone, Runtime.Leds.true_effect)
         self.lighting.set_color1(self.zone, Runtime.Leds.color1)
@@ -4,6 +4,8 @@ from kevinbotv3.piper import BaseTTSEngine
 
 
 class SpeechCommand(Command):
+    __slots__ = ("speaker", "text")
+
     def __init__(self, speaker: BaseTTSEngine, text: str):
         super().__init__()
         self.speaker = speaker
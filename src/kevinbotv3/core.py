@@ -1,13 +1,17 @@
 # Kevinbot Core Implementation for KevinbotLib
 import time
 from enum import IntEnum, StrEnum
-from threading import Thread
+from threading import Event, Lock, Thread
 
+import numpy as np
 from kevinbotlib.hardware.controllers.keyvalue import RawKeyValueSerialController
 from kevinbotlib.hardware.interfaces.serial import RawSerialInterface
 from kevinbotlib.logger import Level, Logger, LoggerWriteOpts
 from kevinbotlib.robot import BaseRobot
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Logger is a thin handle over the global sink; one per module avoids rebuilding it per call
+_LOG = Logger()
 
 
 class MotorDriveStatus(IntEnum):
@@ -26,42 +30,69 @@ class MotorDriveStatus(IntEnum):
 
 
 class CoreStatus(BaseModel):
+    # immutable so readers always see a consistent snapshot; KevinbotCore swaps in updated copies
+    model_config = ConfigDict(frozen=True)
+
     linked: bool = False
     enabled: bool = False
 
 
+# key/value payloads for boolean flags, indexed by the flag
+_BOOL_PAYLOADS = (b"0", b"1")
+
+# rows of KevinbotDrivebase._telemetry, one column per motor
+_POWERS_ROW = 0
+_WATTS_ROW = 1
+_AMPS_ROW = 2
+
+
 class KevinbotDrivebase:
     def __init__(self, core: "KevinbotCore") -> None:
         self._core = core
-        self._powers = [0.0, 0.0]
-        self._watts = [0, 0]
-        self._amps = [0, 0]
+        # the core's controller never changes, so bind its write once
+        self._write = core.controller.write
+        self._telemetry = np.zeros((3, 2), dtype=np.float64)
         self._states = [MotorDriveStatus.UNKNOWN, MotorDriveStatus.UNKNOWN]
 
+        # last command sent by each drive method, so repeated identical commands can be skipped
+        self._last_power: tuple[int, int] | None = None
+        self._last_direction: tuple[int, int] | None = None
+
     def drive_at_power(self, left: float, right: float):
-        self._core.controller.write(b"\x07\x01", f"{int(left*100)},{int(right*100)}".encode())
+        command = (int(left * 100), int(right * 100))
+        if command == self._last_power:
+            return
+        self._last_power = command
+        self._last_direction = None
+        self._write(b"\x07\x01", b"%d,%d" % command)
 
     def drive_direction(self, power: float, direction: float):
-        self._core.controller.write(b"\x07\x02", f"{int(power*100)},{int(direction*100)}".encode())
+        command = (int(power * 100), int(direction * 100))
+        if command == self._last_direction:
+            return
+        self._last_direction = command
+        self._last_power = None
+        self._write(b"\x07\x02", b"%d,%d" % command)
 
     def set_hold(self, hold: bool):  # noqa: FBT001
-        self._core.controller.write(b"\x07\x03", f"{int(hold)}".encode())
+        self._write(b"\x07\x03", _BOOL_PAYLOADS[hold])
 
     @property
-    def amps(self):
-        return self._amps
+    def amps(self) -> list[float]:
+        # a copy: the rx thread overwrites the telemetry rows in place
+        return self._telemetry[_AMPS_ROW].tolist()
 
     @property
-    def watts(self):
-        return self._watts
+    def watts(self) -> list[float]:
+        return self._telemetry[_WATTS_ROW].tolist()
 
     @property
     def states(self):
         return self._states
 
     @property
-    def powers(self):
-        return self._powers
+    def powers(self) -> list[float]:
+        return self._telemetry[_POWERS_ROW].tolist()
 
 
 class LightingZone(IntEnum):
@@ -86,156 +117,189 @@ class LightingEffect(StrEnum):
     fire = "fire"
 
 
+_EFFECT_PAYLOADS = {effect: effect.value.encode() for effect in LightingEffect}
+
+_EFFECT_COMMANDS = {LightingZone.Base: b"\x06\x20", LightingZone.Body: b"\x06\x10", LightingZone.Head: b"\x06\x00"}
+_COLOR1_COMMANDS = {LightingZone.Base: b"\x06\x21", LightingZone.Body: b"\x06\x11", LightingZone.Head: b"\x06\x01"}
+_COLOR2_COMMANDS = {LightingZone.Base: b"\x06\x22", LightingZone.Body: b"\x06\x12", LightingZone.Head: b"\x06\x02"}
+_UPDATE_COMMANDS = {LightingZone.Base: b"\x06\x23", LightingZone.Body: b"\x06\x13", LightingZone.Head: b"\x06\x03"}
+_BRIGHTNESS_COMMANDS = {LightingZone.Base: b"\x06\x24", LightingZone.Body: b"\x06\x14", LightingZone.Head: b"\x06\x04"}
+
+
 class KevinbotLighting:
     def __init__(self, core: "KevinbotCore") -> None:
         self._core = core
+        self._write = core.controller.write
 
     def set_effect(self, zone: LightingZone, effect: LightingEffect):
-        if zone == LightingZone.Base:
-            self._core.controller.write(b"\x06\x20", f"{effect}".encode())
-        elif zone == LightingZone.Body:
-            self._core.controller.write(b"\x06\x10", f"{effect}".encode())
-        elif zone == LightingZone.Head:
-            self._core.controller.write(b"\x06\x00", f"{effect}".encode())
+        self._write(_EFFECT_COMMANDS[zone], _EFFECT_PAYLOADS[effect])
 
     def set_color1(self, zone: LightingZone, color: tuple[int, int, int] | tuple[int, int, int, int]):
         # convert to hex
         if len(color) == 3:  # noqa: PLR2004
-            color = (color[0], color[1], color[2], 0)
+            color = (*color, 0)
         elif len(color) != 4:  # noqa: PLR2004
             msg = "Color must be a tuple of 3 or 4 integers"
             raise ValueError(msg)
-        hex_color = f"{color[0]:02X}{color[1]:02X}{color[2]:02X}{color[3]:02X}"
-        if zone == LightingZone.Base:
-            self._core.controller.write(b"\x06\x21", hex_color.encode())
-        elif zone == LightingZone.Body:
-            self._core.controller.write(b"\x06\x11", hex_color.encode())
-        elif zone == LightingZone.Head:
-            self._core.controller.write(b"\x06\x01", hex_color.encode())
+        self._write(_COLOR1_COMMANDS[zone], bytes(color).hex().upper().encode("ascii"))
 
     def set_color2(self, zone: LightingZone, color: tuple[int, int, int]):
         # convert to hex
-        hex_color = f"{color[0]:02X}{color[1]:02X}{color[2]:02X}"
-        if zone == LightingZone.Base:
-            self._core.controller.write(b"\x06\x22", hex_color.encode())
-        elif zone == LightingZone.Body:
-            self._core.controller.write(b"\x06\x12", hex_color.encode())
-        elif zone == LightingZone.Head:
-            self._core.controller.write(b"\x06\x02", hex_color.encode())
+        self._write(_COLOR2_COMMANDS[zone], bytes(color[:3]).hex().upper().encode("ascii"))
 
     def set_update(self, zone: LightingZone, update: int):
-        if zone == LightingZone.Base:
-            self._core.controller.write(b"\x06\x23", str(update).encode())
-        elif zone == LightingZone.Body:
-            self._core.controller.write(b"\x06\x13", str(update).encode())
-        elif zone == LightingZone.Head:
-            self._core.controller.write(b"\x06\x03", str(update).encode())
+        self._write(_UPDATE_COMMANDS[zone], str(update).encode())
 
     def set_brightness(self, zone: LightingZone, brightness: int):
-        if zone == LightingZone.Base:
-            self._core.controller.write(b"\x06\x24", str(brightness).encode())
-        elif zone == LightingZone.Body:
-            self._core.controller.write(b"\x06\x14", str(brightness).encode())
-        elif zone == LightingZone.Head:
-            self._core.controller.write(b"\x06\x04", str(brightness).encode())
+        self._write(_BRIGHTNESS_COMMANDS[zone], str(brightness).encode())
 
 
 class KevinbotBms(BaseModel):
-    voltages: list[float] = []
+    model_config = ConfigDict(frozen=True)
+
+    voltages: tuple[float, ...] = ()
+
+
+_MIN_RX_TIMEOUT = 0.1
+
+_DELIMITER = b"\xfa"
+_TERMINATOR = b"\xfe"
+
+# handshake sequence, pre-framed so it goes out in a single interface write
+_HANDSHAKE_FRAMES = b"".join(
+    (
+        b"\x02\x04" + _TERMINATOR,
+        b"\x02\x02" + _TERMINATOR,
+        b"\x04\x01" + _DELIMITER + b"0" + _TERMINATOR,
+        b"\x03\x05" + _TERMINATOR,
+    )
+)
 
 
 class KevinbotCore:
     def __init__(self, interface: RawSerialInterface, heartbeat_interval: float = 1, battery_count: int = 1) -> None:
-        self._controller = RawKeyValueSerialController(interface, b"\xfa", b"\xfe")
-        BaseRobot.register_estop_hook(lambda: self.estop())
+        # a zero timeout makes every read non-blocking, which would turn _rx_loop into a busy spin
+        if interface.timeout == 0:
+            interface.timeout = _MIN_RX_TIMEOUT
+        self._controller = RawKeyValueSerialController(interface, _DELIMITER, _TERMINATOR)
+        BaseRobot.register_estop_hook(self.estop)
         self.heartbeat_interval = heartbeat_interval
+        self._heartbeat_stop = Event()
 
         self.battery_count = battery_count
         self._status = CoreStatus()
-        self._bms = KevinbotBms()
+        # begin/unlink and the rx thread all swap _status; the lock stops one undoing another, reads stay lock-free
+        self._status_lock = Lock()
+        self._bms = KevinbotBms(voltages=(0.0,) * self.battery_count)
         self._drivebase = KevinbotDrivebase(self)
-        self._bms.voltages = [0.0] * self.battery_count
+        self._lighting = KevinbotLighting(self)
 
     def begin(self) -> None:
         """Begin a new connection to the Kevinbot Core (formerly Kevinbot Hardware Core)"""
-        self._controller.write(b"\x02\x04")
-        self._controller.write(b"\x02\x02")
-        self._controller.write(b"\x04\x01", b"0")
-        self._controller.write(b"\x03\x05")
-        self._status.linked = True
+        self._handshake()
+        self._update_status(linked=True)
+        self._heartbeat_stop.clear()
         Thread(target=self.heartbeat_loop, daemon=True, name="KevinbotV3.Core.Heartbeat").start()
         Thread(target=self._rx_loop, daemon=True, name="KevinbotV3.Core.Rx").start()
 
+    def _handshake(self):
+        self._controller.interface.write(_HANDSHAKE_FRAMES)
+
     def unlink(self):
         self._controller.write(b"\x02\x03")
-        self._status.linked = False
+        self._update_status(linked=False)
+        self._heartbeat_stop.set()
 
     def estop(self):
         self._controller.write(b"\x04\x02")
         self._controller.interface.flush()
-        Logger().warning("Sent core emergency stop command")
+        _LOG.warning("Sent core emergency stop command")
 
     def request_state_update(self, enabled: bool):  # noqa: FBT001
         if enabled == self._status.enabled:
             return
-        self._controller.write(b"\x04\x01", str(int(enabled)).encode())
+        self._controller.write(b"\x04\x01", _BOOL_PAYLOADS[enabled])
+
+    def _update_status(self, **update):
+        with self._status_lock:
+            self._status = self._status.model_copy(update=update)
 
     def heartbeat_loop(self):
-        while True:
-            if not self._status.linked:
-                return
+        # track an absolute deadline so write latency doesn't accumulate into the period
+        deadline = time.monotonic()
+        while self._status.linked:
             self._controller.write(b"\x02\x01")
-            time.sleep(self.heartbeat_interval)
+            deadline += self.heartbeat_interval
+            if self._heartbeat_stop.wait(max(0.0, deadline - time.monotonic())):
+                return
+
+    def _on_enabled(self, value: bytes):
+        self._update_status(enabled=value == b"true")
+
+    def _on_handshake_request(self, _value: bytes):
+        _LOG.warning("Received handshake request from core")
+        self._handshake()
+
+    def _on_bms_voltages(self, value: bytes):
+        # float() parses ASCII bytes directly; only the tracked batteries are decoded
+        voltages = tuple(float(v) / 100 for v in value.split(b",", self.battery_count)[: self.battery_count])
+        self._bms = self._bms.model_copy(update={"voltages": voltages})
+
+    def _on_motor_watts(self, value: bytes):
+        watts = np.array(value.split(b","), dtype=np.float64) / 1000
+        if len(watts) != 2:  # noqa: PLR2004
+            _LOG.error(f"Received {len(watts)} watts, expected 2")
+        else:
+            self.drivebase._telemetry[_WATTS_ROW] = watts  # noqa: SLF001
+
+    def _on_motor_amps(self, value: bytes):
+        amps = np.array(value.split(b","), dtype=np.float64) / 10000
+        if len(amps) != 2:  # noqa: PLR2004
+            _LOG.error(f"Received {len(amps)} amps, expected 2")
+        else:
+            self.drivebase._telemetry[_AMPS_ROW] = amps  # noqa: SLF001
+
+    def _on_motor_status(self, value: bytes):
+        statuses = [MotorDriveStatus(int(s.decode())) for s in value.split(b",")]
+        if len(statuses) != 2:  # noqa: PLR2004
+            _LOG.error(f"Received {len(statuses)} statuses, expected 2")
+        else:
+            self.drivebase._states = statuses  # noqa: SLF001
+
+    def _on_motor_powers(self, value: bytes):
+        powers = np.array(value.split(b","), dtype=np.float64) / 100
+        if len(powers) != 2:  # noqa: PLR2004
+            _LOG.error(f"Received {len(powers)} powers, expected 2")
+        else:
+            self.drivebase._telemetry[_POWERS_ROW] = powers  # noqa: SLF001
 
     def _rx_loop(self):
+        handlers = {
+            b"core.enabled": self._on_enabled,
+            b"connection.requesthandshake": self._on_handshake_request,
+            b"bms.voltages": self._on_bms_voltages,
+            b"motors.watts": self._on_motor_watts,
+            b"motors.amps": self._on_motor_amps,
+            b"motors.status": self._on_motor_status,
+            b"motors.powers": self._on_motor_powers,
+        }
+
         while True:
             try:
                 if not self._status.linked:
                     return
 
+                # blocks until a full frame arrives or the interface timeout elapses
                 data = self._controller.read()
                 if not data:
                     continue
                 key, value = data
 
-                match key:
-                    case b"core.enabled":
-                        self._status.enabled = value == b"true"
-                    case b"connection.requesthandshake":
-                        Logger().warning("Received handshake request from core")
-                        self._controller.write(b"\x02\x04")
-                        self._controller.write(b"\x02\x02")
-                        self._controller.write(b"\x04\x01", b"0")
-                        self._controller.write(b"\x03\x05")
-                    case b"bms.voltages":
-                        voltages = [float(v.decode()) / 100 for v in value.split(b",")]
-                        self._bms.voltages = voltages[:self.battery_count]
-                    case b"motors.watts":
-                        watts = [float(w.decode()) / 1000 for w in value.split(b",")]
-                        if len(watts) != 2:  # noqa: PLR2004
-                            Logger().error(f"Received {len(watts)} watts, expected 2")
-                        else:
-                            self.drivebase._watts = watts  # noqa: SLF001
-                    case b"motors.amps":
-                        amps = [float(a.decode()) / 10000 for a in value.split(b",")]
-                        if len(amps) != 2:  # noqa: PLR2004
-                            Logger().error(f"Received {len(amps)} amps, expected 2")
-                        else:
-                            self.drivebase._amps = amps  # noqa: SLF001
-                    case b"motors.status":
-                        statuses = [MotorDriveStatus(int(s.decode())) for s in value.split(b",")]
-                        if len(statuses) != 2:  # noqa: PLR2004
-                            Logger().error(f"Received {len(statuses)} statuses, expected 2")
-                        else:
-                            self.drivebase._states = statuses  # noqa: SLF001
-                    case b"motors.powers":
-                        powers = [float(p.decode()) / 100 for p in value.split(b",")]
-                        if len(powers) != 2:  # noqa: PLR2004
-                            Logger().error(f"Received {len(powers)} powers, expected 2")
-                        else:
-                            self.drivebase._powers = powers  # noqa: SLF001
+                handler = handlers.get(key)
+                if handler:
+                    handler(value)
             except (ValueError, UnicodeDecodeError) as e:
-                Logger().log(Level.ERROR, f"Failed to parse data from core: {e!r}", LoggerWriteOpts(exception=e))
+                _LOG.log(Level.ERROR, f"Failed to parse data from core: {e!r}", LoggerWriteOpts(exception=e))
 
     @property
     def controller(self) -> RawKeyValueSerialController:
@@ -255,4 +319,4 @@ class KevinbotCore:
 
     @property
     def lighting(self) -> KevinbotLighting:
-        return KevinbotLighting(self)
+        return self._lighting
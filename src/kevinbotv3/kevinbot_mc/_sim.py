@@ -1,5 +1,6 @@
 from typing import Any, Dict
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget,
@@ -119,11 +120,47 @@ class MotorControlView(QWidget):
         main_layout.addWidget(self.signals_group)
         main_layout.addStretch(1)
 
+        # Label text is staged here and written out at most once per display frame,
+        # so a burst of payloads only repaints the labels once.
+        self._labels: Dict[str, QLabel] = {
+            "enabled": self.enabled_label,
+            "mode": self.mode_label,
+            "target": self.target_label,
+            "angle": self.angle_label,
+            "velocity": self.velocity_label,
+            "i_q": self.i_q_label,
+            "i_d": self.i_d_label,
+            "v_q": self.v_q_label,
+            "v_d": self.v_d_label,
+            "v_in": self.v_in_label,
+            "u_a": self.u_a_label,
+            "i_a": self.i_a_label,
+        }
+        self._pending: Dict[str, str] = {}
+        self._shown: Dict[str, str] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush)
+
         # Wiring
         self.enable_button.clicked.connect(self._on_toggle_enabled)
         self.apply_button.clicked.connect(self._on_apply)
         self.mode_combo.currentTextChanged.connect(self._on_mode_changed)
 
+    def _set_label(self, key: str, text: str) -> None:
+        self._pending[key] = text
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        for key, text in self._pending.items():
+            # skip labels whose text wouldn't change to avoid a needless relayout/repaint
+            if self._shown.get(key) != text:
+                self._labels[key].setText(text)
+                self._shown[key] = text
+        self._pending.clear()
+
     # ---- UI -> Simulator helpers ------------------------------------------------
     def _send_to_sim(self, payload: Dict[str, Any]) -> None:
         if BaseRobot.instance and getattr(BaseRobot.instance, "simulator", None):
@@ -141,8 +178,8 @@ class MotorControlView(QWidget):
             "value": bool(pressed),
         }
         self._send_to_sim(payload)
-        # reflect tentative state in UI immediately
-        self.enabled_label.setText("Enabled" if pressed else "Disabled")
+        # reflect tentative state in UI
+        self._set_label("enabled", "Enabled" if pressed else "Disabled")
 
     def _on_mode_changed(self, mode: str) -> None:
         payload = {"type": "request_mode", "name": self._name, "mode": mode}
@@ -166,7 +203,7 @@ class MotorControlView(QWidget):
         if t in ("status", "enabled", "state"):
             enabled = payload.get("enabled")
             if enabled is not None:
-                self.enabled_label.setText("Enabled" if enabled else "Disabled")
+                self._set_label("enabled", "Enabled" if enabled else "Disabled")
                 self.enable_button.setChecked(bool(enabled))
                 self.enable_button.setText("Disable" if enabled else "Enable")
         if t in ("control", "status", "control_update", "request"):
@@ -175,46 +212,47 @@ class MotorControlView(QWidget):
                 # try to set mode in combo if present
                 idx = self.mode_combo.findText(str(mode))
                 if idx >= 0:
-                    self.mode_combo.setCurrentIndex(idx)
+                    if idx != self.mode_combo.currentIndex():
+                        self.mode_combo.setCurrentIndex(idx)
                 else:
                     # unknown mode: add it (non-destructive)
                     self.mode_combo.addItem(str(mode))
                     self.mode_combo.setCurrentText(str(mode))
-                self.mode_label.setText(str(mode))
+                self._set_label("mode", str(mode))
             target = payload.get("target")
             if target is not None:
                 try:
                     self.target_spin.setValue(float(target))
                 except Exception:
                     pass
-                self.target_label.setText(_fmt(target))
+                self._set_label("target", _fmt(target))
         if t in ("signals", "signal", "status"):
             # top-level signals
             if "angle" in payload:
-                self.angle_label.setText(_fmt(payload["angle"]))
+                self._set_label("angle", _fmt(payload["angle"]))
             if "velocity" in payload:
-                self.velocity_label.setText(_fmt(payload["velocity"]))
+                self._set_label("velocity", _fmt(payload["velocity"]))
             # nested maps
             currents = payload.get("currents") or {}
             if isinstance(currents, dict):
                 if "i_q" in currents:
-                    self.i_q_label.setText(_fmt(currents["i_q"]))
+                    self._set_label("i_q", _fmt(currents["i_q"]))
                 if "i_d" in currents:
-                    self.i_d_label.setText(_fmt(currents["i_d"]))
+                    self._set_label("i_d", _fmt(currents["i_d"]))
             voltages = payload.get("voltages") or {}
             if isinstance(voltages, dict):
                 if "v_q" in voltages:
-                    self.v_q_label.setText(_fmt(voltages["v_q"]))
+                    self._set_label("v_q", _fmt(voltages["v_q"]))
                 if "v_d" in voltages:
-                    self.v_d_label.setText(_fmt(voltages["v_d"]))
+                    self._set_label("v_d", _fmt(voltages["v_d"]))
                 if "v_in" in voltages:
-                    self.v_in_label.setText(_fmt(voltages["v_in"]))
+                    self._set_label("v_in", _fmt(voltages["v_in"]))
             phases = payload.get("phases") or {}
             if isinstance(phases, dict):
                 if "u_a" in phases:
-                    self.u_a_label.setText(_fmt(phases["u_a"]))
+                    self._set_label("u_a", _fmt(phases["u_a"]))
                 if "i_a" in phases:
-                    self.i_a_label.setText(_fmt(phases["i_a"]))
+                    self._set_label("i_a", _fmt(phases["i_a"]))
 
 
 @register_window_view("kevinbotmc.motor")
@@ -26,6 +26,10 @@ class AbstractMotorConnection(abc.ABC):
     def add_signal_callback(self, callback: Callable[[int, TransactionData], Any]) -> None:
         pass
 
+    @abc.abstractmethod
+    def add_signal_batch_callback(self, callback: Callable[[dict[int, TransactionData]], Any]) -> None:
+        """Subscribe to signals delivered as one {control word: value} dict per received batch"""
+
     @property
     def is_open(self):
         return False
@@ -3,9 +3,7 @@ import threading
 import time
 from collections import deque
 from collections.abc import Callable
-from typing import Any, Final
-
-import modbus_crc
+from typing import Any
 
 from kevinbotlib.hardware.interfaces.serial import RawSerialInterface
 from kevinbotlib.logger import Logger
@@ -17,8 +15,32 @@ from kevinbotv3.kevinbot_mc.protocol import (
     TransactionStatusCodes,
     TransactionDataType,
     TransactionResult,
+    crc16,
     make_response_data,
 )
+from kevinbotv3.util import lower_serial_latency
+
+
+_LOG = Logger()
+
+# upper bound on a single read; larger bursts are picked up on the next pass
+_MAX_READ_SIZE = 4096
+# initial size of the reusable transmit buffer; grown on demand for larger payloads
+_TX_BUFFER_SIZE = 2048
+# delay before retry n is BASE * 2**n seconds, capped at MAX
+_RETRY_BACKOFF_BASE = 0.005
+_RETRY_BACKOFF_MAX = 0.05
+
+_U16 = struct.Struct(">H")
+# fields following the start marker
+_RESPONSE_HEADER = struct.Struct(">BBHH")  # status, data_type, control_word, data_len
+_UNSOLICITED_HEADER = struct.Struct(">BHH")  # data_type, control_word, data_len
+_REQUEST_HEADER = struct.Struct(">BBHH")  # start marker, data_type, control_word, data_len
+
+# plain dict lookups are much cheaper per frame than calling the enum constructors;
+# an unknown code raises KeyError and the frame is dropped like any other parse error
+_STATUS_CODES = {code.value: code for code in TransactionStatusCodes}
+_DATA_TYPES = {dtype.value: dtype for dtype in TransactionDataType}
 
 
 class SerialUidController:
@@ -38,17 +60,19 @@ class SerialMotorConnection(AbstractMotorConnection):
         self.baud = baud
         self.serial = RawSerialInterface(None, port, baud)
 
-        self.signal_callbacks: list[Callable[[int, TransactionData], Any]] = []
-        self.unsolicited_callbacks: list[Callable[[int, TransactionData], Any]] = []
+        # Subscribers are immutable snapshots; adding one swaps in a new tuple under _cb_lock
+        self.signal_callbacks: tuple[Callable[[int, TransactionData], Any], ...] = ()
+        self.unsolicited_callbacks: tuple[Callable[[int, TransactionData], Any], ...] = ()
+        self.signal_batch_callbacks: tuple[Callable[[dict[int, TransactionData]], Any], ...] = ()
+        self._cb_lock = threading.Lock()
 
         self.read_thread: threading.Thread | None = None
         self.running: bool = False
         self.running_lock = threading.Lock()
 
-        # Thread-safe frame queues
-        self.response_queue: deque = deque()
+        # Unsolicited frame queue; deque append/popleft are atomic, the event wakes the dispatcher
         self.unsolicited_queue: deque = deque()
-        self.queue_lock = threading.Lock()
+        self._unsolicited_event = threading.Event()
 
         # Pending response tracking
         self.waiting_responses: dict[int, threading.Event] = {}
@@ -56,8 +80,12 @@ class SerialMotorConnection(AbstractMotorConnection):
         self.response_lock = threading.Lock()
 
         self.uid_controller = SerialUidController()
+        # RX buffer; only ever touched by the single _read_loop thread, so it needs no lock
         self.buffer = bytearray()
-        self.buffer_lock = threading.Lock()
+
+        # Outgoing frames are packed into one reusable buffer
+        self._tx_buf = bytearray(_TX_BUFFER_SIZE)
+        self._tx_lock = threading.Lock()
 
     def _is_running(self):
         with self.running_lock:
@@ -68,49 +96,65 @@ class SerialMotorConnection(AbstractMotorConnection):
             self.running = value
 
     def _parse_all_frames(self):
-        """Parse all complete frames from buffer and queue them appropriately."""
-        with self.buffer_lock:
-            max_iterations = len(self.buffer)
-            iterations = 0
+        """Parse all complete frames from buffer and queue them appropriately.
+
+        Runs on the reader thread, which owns `self.buffer`.
+        """
+        buf = self.buffer
+        pos = 0
 
-            while len(self.buffer) >= 8 and iterations < max_iterations:
-                iterations += 1
-                parsed, frame_type, consumed = self._try_parse_next_frame()
+        # walk the buffer with a cursor and compact once at the end, rather than
+        # shifting the remaining bytes down after every frame
+        # the view has to be released before the buffer is resized below
+        with memoryview(buf) as view:
+            while len(view) - pos >= 8:
+                parsed, frame_type, consumed = self._try_parse_next_frame(view, pos)
 
                 if consumed == 0:
                     break
 
                 if parsed is None:
-                    Logger().warning(
+                    _LOG.warning(
                         f"Frame parse error, dropping 1 byte and retrying. "
-                        f"Buffer start: {self.buffer[:16].hex()}"
+                        f"Buffer start: {view[pos:pos + 16].hex()}"
                     )
-                    del self.buffer[0:1]
+                    pos += 1
                     continue
 
-                del self.buffer[0:consumed]
-
-                with self.queue_lock:
-                    if frame_type == 0x01:
-                        self.response_queue.append(parsed)
-                        Logger().trace(f"Queued response UID={parsed['uid']}, "
-                                     f"queue size={len(self.response_queue)}")
-                    elif frame_type == 0x02:
-                        self.unsolicited_queue.append(parsed)
-                        Logger().trace(f"Queued unsolicited frame, "
-                                     f"queue size={len(self.unsolicited_queue)}")
+                pos += consumed
 
-    def _try_parse_next_frame(self):
-        """Try to parse the next frame at the start of the buffer.
+                if frame_type == 0x01:
+                    # hand the response straight to the waiting execute() call, if any
+                    uid = parsed["uid"]
+                    with self.response_lock:
+                        if uid in self.waiting_responses:
+                            self.response_data[uid] = parsed
+                            self.waiting_responses[uid].set()
+                            _LOG.trace(f"Delivered response UID={uid}")
+                        else:
+                            _LOG.trace(f"Dropped response UID={uid} with no pending transaction")
+                elif frame_type == 0x02:
+                    self.unsolicited_queue.append(parsed)
+                    self._unsolicited_event.set()
+                    _LOG.trace(f"Queued unsolicited frame, "
+                                 f"queue size={len(self.unsolicited_queue)}")
+
+        if pos:
+            del buf[:pos]
+
+    def _try_parse_next_frame(self, buf: memoryview, offset: int):
+        """Try to parse the next frame starting at `offset` in `buf`.
+
+        Only the payload is copied out; the CRC and UID are read in place.
 
         Returns: (parsed_dict or None, frame_type or None, bytes_consumed)
         """
-        buf = self.buffer
+        available = len(buf) - offset
 
-        if len(buf) < 8:
+        if available < 8:
             return None, None, 0
 
-        start_marker = buf[0]
+        start_marker = buf[offset]
 
         try:
             if start_marker == 0x01:
@@ -118,39 +162,34 @@ class SerialMotorConnection(AbstractMotorConnection):
                 HEADER_SIZE = 7
                 TAIL_SIZE = 4
 
-                if len(buf) < HEADER_SIZE:
+                if available < HEADER_SIZE:
                     return None, None, 0
 
-                status = buf[1]
-                data_type = buf[2]
-                control_word = struct.unpack(">H", buf[3:5])[0]
-                data_len = struct.unpack(">H", buf[5:7])[0]
+                status, data_type, control_word, data_len = _RESPONSE_HEADER.unpack_from(buf, offset + 1)
 
                 total_len = HEADER_SIZE + data_len + TAIL_SIZE
 
-                if len(buf) < total_len:
+                if available < total_len:
                     return None, None, 0
 
-                frame = buf[0:total_len]
-
-                if not modbus_crc.check_crc(frame):
-                    Logger().error(f"CRC mismatch in response frame. Start: {frame[:16].hex()}")
+                if crc16(buf[offset:offset + total_len]):
+                    _LOG.error(f"CRC mismatch in response frame. Start: {buf[offset:offset + 16].hex()}")
                     return None, None, 1
 
-                data_payload = frame[7:7 + data_len]
-                uid = struct.unpack(">H", frame[7 + data_len:9 + data_len])[0]
+                data_payload = bytes(buf[offset + 7:offset + 7 + data_len])
+                uid = _U16.unpack_from(buf, offset + 7 + data_len)[0]
 
                 FAILURE_CONTROL_WORD = 0x7FFF
                 if control_word == FAILURE_CONTROL_WORD:
-                    Logger().error(
+                    _LOG.error(
                         f"Response has FAILURE control word ({hex(FAILURE_CONTROL_WORD)}). "
                         f"Status: {status}, Data Type: {data_type}, UID: {uid}"
                     )
 
                 parsed = {
                     "frame_type": 0x01,
-                    "status": TransactionStatusCodes(status),
-                    "data_type": TransactionDataType(data_type),
+                    "status": _STATUS_CODES[status],
+                    "data_type": _DATA_TYPES[data_type],
                     "control_word": control_word,
                     "data": data_payload,
                     "uid": uid,
@@ -163,29 +202,25 @@ class SerialMotorConnection(AbstractMotorConnection):
                 HEADER_SIZE = 6
                 TAIL_SIZE = 2
 
-                if len(buf) < HEADER_SIZE:
+                if available < HEADER_SIZE:
                     return None, None, 0
 
-                data_type = buf[1]
-                control_word = struct.unpack(">H", buf[2:4])[0]
-                data_len = struct.unpack(">H", buf[4:6])[0]
+                data_type, control_word, data_len = _UNSOLICITED_HEADER.unpack_from(buf, offset + 1)
 
                 total_len = HEADER_SIZE + data_len + TAIL_SIZE
 
-                if len(buf) < total_len:
+                if available < total_len:
                     return None, None, 0
 
-                frame = buf[0:total_len]
-
-                if not modbus_crc.check_crc(frame):
-                    Logger().error(f"CRC mismatch in unsolicited frame. Start: {frame[:16].hex()}")
+                if crc16(buf[offset:offset + total_len]):
+                    _LOG.error(f"CRC mismatch in unsolicited frame. Start: {buf[offset:offset + 16].hex()}")
                     return None, None, 1
 
-                data_payload = frame[6:6 + data_len]
+                data_payload = bytes(buf[offset + 6:offset + 6 + data_len])
 
                 parsed = {
                     "frame_type": 0x02,
-                    "data_type": TransactionDataType(data_type),
+                    "data_type": _DATA_TYPES[data_type],
                     "control_word": control_word,
                     "data": data_payload,
                 }
@@ -193,60 +228,59 @@ class SerialMotorConnection(AbstractMotorConnection):
                 return parsed, 0x02, total_len
 
             else:
-                Logger().error(f"Unknown start marker: 0x{start_marker:02X}")
+                _LOG.error(f"Unknown start marker: 0x{start_marker:02X}")
                 return None, None, 1
 
         except Exception as e:
-            Logger().error(f"Exception during frame parse: {e}")
+            _LOG.error(f"Exception during frame parse: {e}")
             return None, None, 1
 
     def _dispatch_unsolicited(self):
         """Process and dispatch unsolicited frames to subscribers."""
+        queue = self.unsolicited_queue
         while self._is_running():
-            with self.queue_lock:
-                if self.unsolicited_queue:
-                    parsed = self.unsolicited_queue.popleft()
-                else:
-                    parsed = None
-
-            if parsed:
-                for sub in self.unsolicited_callbacks:
+            if not self._unsolicited_event.wait(0.5):
+                continue
+            # clear before draining so a frame queued mid-drain re-arms the event
+            self._unsolicited_event.clear()
+
+            # signal frames are coalesced per drain, keeping only the newest frame per word
+            batch_subscribers = self.signal_batch_callbacks
+            pending_signals: dict[int, dict] = {}
+
+            while queue:
+                parsed = queue.popleft()
+                control_word = parsed["control_word"]
+                subscribers = self.unsolicited_callbacks
+                if control_word <= 0x7FFF:
+                    subscribers += self.signal_callbacks
+                    if batch_subscribers:
+                        pending_signals[control_word] = parsed
+                if not subscribers:
+                    continue
+
+                data = make_response_data(parsed["data_type"], parsed["data"])
+                for sub in subscribers:
                     try:
-                        sub(
-                            parsed["control_word"],
-                            make_response_data(parsed["data_type"], parsed["data"]),
-                        )
+                        sub(control_word, data)
                     except Exception as e:
-                        Logger().error(f"Error in unsolicited subscriber: {e}")
-                if parsed["control_word"] <= 0x7FFF:
-                    for sub in self.signal_callbacks:
-                        try:
-                            sub(
-                                parsed["control_word"],
-                                make_response_data(parsed["data_type"], parsed["data"]),
-                            )
-                        except Exception as e:
-                            Logger().error(f"Error in unsolicited subscriber: {e}")
-            else:
-                time.sleep(0.001)
-
-    def _find_response_for_uid(self, uid: int):
-        """Search response queue for a matching UID and remove it.
+                        _LOG.error(f"Error in unsolicited subscriber: {e}")
 
-        Returns: parsed response dict or None
-        """
-        with self.queue_lock:
-            for i, response in enumerate(self.response_queue):
-                if response["uid"] == uid:
-                    del self.response_queue[i]
-                    Logger().trace(f"Found response for UID={uid} at queue position {i}")
-                    return response
-        return None
+            if pending_signals:
+                batch = {
+                    word: make_response_data(parsed["data_type"], parsed["data"])
+                    for word, parsed in pending_signals.items()
+                }
+                for sub in batch_subscribers:
+                    try:
+                        sub(batch)
+                    except Exception as e:
+                        _LOG.error(f"Error in signal batch subscriber: {e}")
 
     def _read_loop(self):
         """Main read loop that processes incoming serial data."""
         self._set_running(True)
-        Logger().info(f"Serial read loop started for {self.port}")
+        _LOG.info(f"Serial read loop started for {self.port}")
 
         unsolicited_thread = threading.Thread(
             target=self._dispatch_unsolicited,
@@ -257,27 +291,16 @@ class SerialMotorConnection(AbstractMotorConnection):
 
         while self._is_running():
             try:
-                new_data = self.serial.read(1)
+                # block for at least one byte, then take everything already buffered by the driver
+                new_data = self.serial.read(min(_MAX_READ_SIZE, max(1, self.serial.in_waiting)))
                 if new_data:
-                    with self.buffer_lock:
-                        self.buffer.extend(new_data)
+                    self.buffer.extend(new_data)
                     self._parse_all_frames()
 
-                    # Process any responses and signal waiting threads
-                    with self.queue_lock:
-                        while self.response_queue:
-                            response = self.response_queue.popleft()
-                            uid = response["uid"]
-
-                            with self.response_lock:
-                                if uid in self.waiting_responses:
-                                    self.response_data[uid] = response
-                                    self.waiting_responses[uid].set()
-
             except TimeoutError:
                 time.sleep(0.001)
             except Exception as e:
-                Logger().error(
+                _LOG.error(
                     f"An error occurred while reading the motor serial port: {e!r} for {self.port}"
                 )
                 self._set_running(False)
@@ -286,6 +309,8 @@ class SerialMotorConnection(AbstractMotorConnection):
         """Open serial port and start read thread."""
         if not self.serial.is_open:
             self.serial.open()
+        if not lower_serial_latency(self.port):
+            _LOG.warning(f"Could not lower the USB latency timer for {self.port}, replies may be delayed")
 
         if not self.read_thread:
             self.read_thread = threading.Thread(
@@ -298,16 +323,23 @@ class SerialMotorConnection(AbstractMotorConnection):
     def stop(self):
         """Stop read thread and close serial port."""
         self._set_running(False)
+        self._unsolicited_event.set()
         if self.read_thread:
             self.read_thread.join(timeout=1.0)
             self.read_thread = None
         self.serial.close()
 
     def add_signal_callback(self, callback: Callable[[int, TransactionData], Any]) -> None:
-        self.signal_callbacks.append(callback)
+        with self._cb_lock:
+            self.signal_callbacks += (callback,)
 
     def add_unsolicited_callback(self, callback: Callable[[int, TransactionData], Any]) -> None:
-        self.unsolicited_callbacks.append(callback)
+        with self._cb_lock:
+            self.unsolicited_callbacks += (callback,)
+
+    def add_signal_batch_callback(self, callback: Callable[[dict[int, TransactionData]], Any]) -> None:
+        with self._cb_lock:
+            self.signal_batch_callbacks += (callback,)
 
     def execute(
         self,
@@ -317,26 +349,14 @@ class SerialMotorConnection(AbstractMotorConnection):
         timeout: float = 0.3,
     ) -> TransactionResult:
         """Execute a transaction and wait for response."""
-        poll_interval: Final[float] = 0.001
-
         for attempt in range(retry + 1):
             uid = self.uid_controller.new()
 
-            # Prepare transaction data
-            gen = data.generate()
-            frame = (
-                b"\x02"
-                + gen[0].to_bytes(1, "big")
-                + control.to_bytes(2, "big")
-                + len(gen[1]).to_bytes(2, "big")
-                + gen[1]
-                + uid.to_bytes(2, "big")
-            )
-            crc = bytearray(modbus_crc.crc16(frame))
-            crc.reverse()
-            frame = frame + crc
-
-            Logger().trace(f"Sending UID={uid}: {frame.hex()}")
+            # Prepare transaction data: [0x02][data_type][control_word][data_len][data...][uid][crc]
+            data_type = data.TYPE_ID
+            payload = data.payload()
+            payload_end = _REQUEST_HEADER.size + len(payload)
+            frame_len = payload_end + 4
 
             # Register this UID as pending
             with self.response_lock:
@@ -345,33 +365,34 @@ class SerialMotorConnection(AbstractMotorConnection):
 
             try:
                 # Send transaction
-                self.serial.write(frame)
-
-                # Wait for response with timeout
-                start_time = time.monotonic()
-                while True:
-                    elapsed = time.monotonic() - start_time
-                    if elapsed >= timeout:
-                        Logger().warning(
-                            f"Timeout on UID={uid} attempt {attempt + 1} "
-                            f"(queue size: {len(self.response_queue)})"
-                        )
-                        break
-
-                    # Check if response arrived
+                with self._tx_lock:
+                    frame = self._tx_buf
+                    if len(frame) < frame_len:
+                        frame.extend(bytes(frame_len - len(frame)))
+                    _REQUEST_HEADER.pack_into(frame, 0, 0x02, data_type, control, len(payload))
+                    frame[_REQUEST_HEADER.size:payload_end] = payload
+                    _U16.pack_into(frame, payload_end, uid)
+                    with memoryview(frame) as view:
+                        _U16.pack_into(frame, payload_end + 2, crc16(view[:payload_end + 2]))
+                        _LOG.trace(f"Sending UID={uid}: {view[:frame_len].hex()}")
+                        self.serial.write(view[:frame_len])
+
+                # The read loop stores the response and sets the event under response_lock
+                if event.wait(timeout):
                     with self.response_lock:
-                        if uid in self.response_data:
-                            response = self.response_data[uid]
-                            del self.response_data[uid]
-                            del self.waiting_responses[uid]
+                        response = self.response_data.pop(uid)
+                        del self.waiting_responses[uid]
 
-                            return TransactionResult(
-                                response["control_word"],
-                                make_response_data(response["data_type"], response["data"]),
-                                response["status"],
-                            )
+                    return TransactionResult(
+                        response["control_word"],
+                        make_response_data(response["data_type"], response["data"]),
+                        response["status"],
+                    )
 
-                    time.sleep(poll_interval)
+                _LOG.warning(
+                    f"Timeout on UID={uid} attempt {attempt + 1} "
+                    f"(pending: {len(self.waiting_responses)})"
+                )
 
             finally:
                 # Clean up
@@ -381,9 +402,9 @@ class SerialMotorConnection(AbstractMotorConnection):
                     if uid in self.response_data:
                         del self.response_data[uid]
 
-            # Retry if not the last attempt
+            # Back off before retrying so a stalled controller isn't flooded with resends
             if attempt < retry:
-                continue
+                time.sleep(min(_RETRY_BACKOFF_BASE * (2 ** attempt), _RETRY_BACKOFF_MAX))
 
         raise TimeoutError(f"No response after {retry + 1} retries")
 
@@ -1,4 +1,4 @@
-from typing import Callable, Any, List
+from typing import Callable, Any
 
 from kevinbotlib.robot import BaseRobot
 
@@ -15,6 +15,18 @@ from kevinbotv3.kevinbot_mc.protocol import (
     PackedTransactionData,
 )
 
+# Empty acknowledgements carry no state, so one shared result per control word is
+# handed out instead of building a new result and payload on every call
+_EMPTY = EmptyTransactionData()
+_OK_RESULTS = {
+    control: TransactionResult(control, _EMPTY, TransactionStatusCodes.OK)
+    for control in (0x0002, 0x0003, 0x0007, 0x2002, 0x2005)
+}
+_INVALID_DATA_RESULTS = {
+    control: TransactionResult(control, _EMPTY, TransactionStatusCodes.INVALID_DATA)
+    for control in (0x0004, 0x0005, 0x0006, 0x2002, 0x3002)
+}
+
 
 class SimulatorMotorConnection(AbstractMotorConnection):
     """
@@ -45,31 +57,54 @@ class SimulatorMotorConnection(AbstractMotorConnection):
         self._control_index = 0
         self._target = 0.0
 
-        # callbacks
-        self._unsolicited: List[Callable[[int, TransactionData], Any]] = []
-        self._signal_callbacks: List[Callable[[int, TransactionData], Any]] = []
+        # callbacks; dicts keep registration order and make duplicate checks O(1)
+        self._unsolicited: dict[Callable[[int, TransactionData], Any], None] = {}
+        self._signal_callbacks: dict[Callable[[int, TransactionData], Any], None] = {}
+        self._signal_batch_callbacks: dict[Callable[[dict[int, TransactionData]], Any], None] = {}
+
+        # simulator UI, resolved in start(); None when running headless
+        self._sim = None
+
+        # control word -> handler, looked up once per execute()
+        self._handlers: dict[int, Callable[[int, TransactionData], TransactionResult]] = {
+            0x7FF8: self._handle_name,
+            0x7FFC: self._handle_fw_version,
+            0x4000: self._handle_watchdog,
+            0x0003: self._handle_feed,
+            0x0002: self._handle_estop,
+            0x0004: self._handle_enable,
+            0x0005: self._handle_target,
+            0x0006: self._handle_mode,
+            0x0007: self._handle_apply,
+            0x2002: self._handle_config,
+            0x2005: self._handle_flash_save,
+            0x3002: self._handle_enable_signal,
+        }
 
     def start(self):
         # create the UI tab if a simulator UI is present
-        if BaseRobot.instance and getattr(BaseRobot.instance, "simulator", None):
+        if BaseRobot.instance:
+            self._sim = getattr(BaseRobot.instance, "simulator", None)
+        self._notify({"type": "create", "name": self._name})
+        # push an initial status update
+        self._notify(
+            {
+                "type": "status",
+                "name": self._name,
+                "enabled": self._enabled,
+                "fw_version": self._fw_version,
+                "watchdog": self._watchdog_interval,
+                "mode": self._control_index,
+                "target": self._target,
+            }
+        )
+
+    def _notify(self, payload: dict) -> None:
+        if self._sim is not None:
             try:
-                BaseRobot.instance.simulator.send_to_window(
-                    "kevinbotmc.motor", {"type": "create", "name": self._name}
-                )
-                # push an initial status update
-                BaseRobot.instance.simulator.send_to_window(
-                    "kevinbotmc.motor",
-                    {
-                        "type": "status",
-                        "name": self._name,
-                        "enabled": self._enabled,
-                        "fw_version": self._fw_version,
-                        "watchdog": self._watchdog_interval,
-                        "mode": self._control_index,
-                        "target": self._target,
-                    },
-                )
-            except Exception:
+                self._sim.send_to_window("kevinbotmc.motor", payload)
+            except ValueError:
+                # the simulator's multiprocessing queue is closed during shutdown
                 pass
 
     def stop(self):
@@ -83,185 +118,149 @@ class SimulatorMotorConnection(AbstractMotorConnection):
         Handle a selection of known control words and return the expected TransactionResult.
         Unknown words return NOT_IMPLEMENTED.
         """
-        # Name query
-        if control == 0x7FF8:
+        handler = self._handlers.get(control)
+        if handler is None:
             return TransactionResult(
-                control, StringTransactionData(self._name), TransactionStatusCodes.OK
+                control, _EMPTY, TransactionStatusCodes.NOT_IMPLEMENTED
             )
+        return handler(control, data)
+
+    # Name query
+    def _handle_name(self, control: int, data: TransactionData) -> TransactionResult:
+        return TransactionResult(
+            control, StringTransactionData(self._name), TransactionStatusCodes.OK
+        )
+
+    # Firmware version query
+    def _handle_fw_version(self, control: int, data: TransactionData) -> TransactionResult:
+        return TransactionResult(
+            control,
+            StringTransactionData(self._fw_version),
+            TransactionStatusCodes.OK,
+        )
 
-        # Firmware version query
-        if control == 0x7FFC:
+    # Watchdog timeout query
+    def _handle_watchdog(self, control: int, data: TransactionData) -> TransactionResult:
+        return TransactionResult(
+            control,
+            UnsignedIntegerTransactionData(self._watchdog_interval, 4),
+            TransactionStatusCodes.OK,
+        )
+
+    # Watchdog feed
+    def _handle_feed(self, control: int, data: TransactionData) -> TransactionResult:
+        return _OK_RESULTS[control]
+
+    # E-stop
+    def _handle_estop(self, control: int, data: TransactionData) -> TransactionResult:
+        # emulate e-stop by disabling motor
+        self._enabled = False
+        return _OK_RESULTS[control]
+
+    # Enable / Disable
+    def _handle_enable(self, control: int, data: TransactionData) -> TransactionResult:
+        # expect BooleanTransactionData
+        if isinstance(data, BooleanTransactionData):
+            self._enabled = bool(data.value)
+            # notify UI of state change
+            self._notify(
+                {
+                    "type": "status",
+                    "name": self._name,
+                    "enabled": self._enabled,
+                }
+            )
             return TransactionResult(
                 control,
-                StringTransactionData(self._fw_version),
+                BooleanTransactionData(self._enabled),
                 TransactionStatusCodes.OK,
             )
+        else:
+            return _INVALID_DATA_RESULTS[control]
 
-        # Watchdog timeout query
-        if control == 0x4000:
+    # Set target (float)
+    def _handle_target(self, control: int, data: TransactionData) -> TransactionResult:
+        if isinstance(data, FloatTransactionData):
+            self._target = float(data.value)
+            self._notify(
+                {
+                    "type": "control",
+                    "name": self._name,
+                    "target": self._target,
+                }
+            )
             return TransactionResult(
                 control,
-                UnsignedIntegerTransactionData(self._watchdog_interval, 4),
+                FloatTransactionData(self._target),
                 TransactionStatusCodes.OK,
             )
+        else:
+            return _INVALID_DATA_RESULTS[control]
 
-        # Watchdog feed
-        if control == 0x0003:
+    # Set control mode (unsigned int)
+    def _handle_mode(self, control: int, data: TransactionData) -> TransactionResult:
+        if isinstance(data, UnsignedIntegerTransactionData):
+            # store index and echo back with same size
+            self._control_index = int(data.value)
             return TransactionResult(
-                control, EmptyTransactionData(), TransactionStatusCodes.OK
-            )
-
-        # E-stop
-        if control == 0x0002:
-            # emulate e-stop by disabling motor
-            self._enabled = False
-            return TransactionResult(
-                control, EmptyTransactionData(), TransactionStatusCodes.OK
+                control,
+                UnsignedIntegerTransactionData(self._control_index, data.size),
+                TransactionStatusCodes.OK,
             )
+        else:
+            return _INVALID_DATA_RESULTS[control]
 
-        # Enable / Disable
-        if control == 0x0004:
-            # expect BooleanTransactionData
-            if isinstance(data, BooleanTransactionData):
-                self._enabled = bool(data.value)
-                # notify UI of state change
-                try:
-                    if BaseRobot.instance and getattr(
-                        BaseRobot.instance, "simulator", None
-                    ):
-                        BaseRobot.instance.simulator.send_to_window(
-                            "kevinbotmc.motor",
-                            {
-                                "type": "status",
-                                "name": self._name,
-                                "enabled": self._enabled,
-                            },
-                        )
-                except Exception:
-                    pass
-                return TransactionResult(
-                    control,
-                    BooleanTransactionData(self._enabled),
-                    TransactionStatusCodes.OK,
-                )
-            else:
-                return TransactionResult(
-                    control, EmptyTransactionData(), TransactionStatusCodes.INVALID_DATA
-                )
-
-        # Set target (float)
-        if control == 0x0005:
-            if isinstance(data, FloatTransactionData):
-                self._target = float(data.value)
-                try:
-                    if BaseRobot.instance and getattr(
-                        BaseRobot.instance, "simulator", None
-                    ):
-                        BaseRobot.instance.simulator.send_to_window(
-                            "kevinbotmc.motor",
-                            {
-                                "type": "control",
-                                "name": self._name,
-                                "target": self._target,
-                            },
-                        )
-                except Exception:
-                    pass
-                return TransactionResult(
-                    control,
-                    FloatTransactionData(self._target),
-                    TransactionStatusCodes.OK,
-                )
-            else:
-                return TransactionResult(
-                    control, EmptyTransactionData(), TransactionStatusCodes.INVALID_DATA
-                )
-
-        # Set control mode (unsigned int)
-        if control == 0x0006:
-            if isinstance(data, UnsignedIntegerTransactionData):
-                # store index and echo back with same size
-                self._control_index = int(data.value)
-                return TransactionResult(
-                    control,
-                    UnsignedIntegerTransactionData(self._control_index, data.size),
-                    TransactionStatusCodes.OK,
-                )
-            else:
-                return TransactionResult(
-                    control, EmptyTransactionData(), TransactionStatusCodes.INVALID_DATA
-                )
-
-        # Apply control
-        if control == 0x0007:
-            # Nothing special to do in-sim; acknowledge
-            try:
-                if BaseRobot.instance and getattr(
-                    BaseRobot.instance, "simulator", None
-                ):
-                    BaseRobot.instance.simulator.send_to_window(
-                        "kevinbotmc.motor",
-                        {
-                            "type": "control",
-                            "name": self._name,
-                            "mode": self._control_index,
-                            "target": self._target,
-                        },
-                    )
-            except Exception:
-                pass
-            return TransactionResult(
-                control, EmptyTransactionData(), TransactionStatusCodes.OK
-            )
+    # Apply control
+    def _handle_apply(self, control: int, data: TransactionData) -> TransactionResult:
+        # Nothing special to do in-sim; acknowledge
+        self._notify(
+            {
+                "type": "control",
+                "name": self._name,
+                "mode": self._control_index,
+                "target": self._target,
+            }
+        )
+        return _OK_RESULTS[control]
 
-        # Apply packed config
-        if control == 0x2002:
-            if isinstance(data, PackedTransactionData):
-                # pretend we applied config
-                return TransactionResult(
-                    control, EmptyTransactionData(), TransactionStatusCodes.OK
-                )
-            else:
-                return TransactionResult(
-                    control, EmptyTransactionData(), TransactionStatusCodes.INVALID_DATA
-                )
+    # Apply packed config
+    def _handle_config(self, control: int, data: TransactionData) -> TransactionResult:
+        if isinstance(data, PackedTransactionData):
+            # pretend we applied config
+            return _OK_RESULTS[control]
+        else:
+            return _INVALID_DATA_RESULTS[control]
 
-        # Flash save
-        if control == 0x2005:
-            return TransactionResult(
-                control, EmptyTransactionData(), TransactionStatusCodes.OK
-            )
+    # Flash save
+    def _handle_flash_save(self, control: int, data: TransactionData) -> TransactionResult:
+        return _OK_RESULTS[control]
 
-        # Enable signal (subscribe)
-        if control == 0x3002:
-            # accept unsigned int specifying signal id
-            if isinstance(data, UnsignedIntegerTransactionData):
-                # for this simple simulator we'll just acknowledge
-                return TransactionResult(
-                    control,
-                    UnsignedIntegerTransactionData(int(data.value), data.size),
-                    TransactionStatusCodes.OK,
-                )
+    # Enable signal (subscribe)
+    def _handle_enable_signal(self, control: int, data: TransactionData) -> TransactionResult:
+        # accept unsigned int specifying signal id
+        if isinstance(data, UnsignedIntegerTransactionData):
+            # for this simple simulator we'll just acknowledge
             return TransactionResult(
-                control, EmptyTransactionData(), TransactionStatusCodes.INVALID_DATA
+                control,
+                UnsignedIntegerTransactionData(int(data.value), data.size),
+                TransactionStatusCodes.OK,
             )
-
-        # Unknown command
-        return TransactionResult(
-            control, EmptyTransactionData(), TransactionStatusCodes.NOT_IMPLEMENTED
-        )
+        return _INVALID_DATA_RESULTS[control]
 
     def add_unsolicited_callback(
         self, callback: Callable[[int, TransactionData], Any]
     ) -> None:
-        if callback not in self._unsolicited:
-            self._unsolicited.append(callback)
+        self._unsolicited.setdefault(callback, None)
 
     def add_signal_callback(
         self, callback: Callable[[int, TransactionData], Any]
     ) -> None:
-        if callback not in self._signal_callbacks:
-            self._signal_callbacks.append(callback)
+        self._signal_callbacks.setdefault(callback, None)
+
+    def add_signal_batch_callback(
+        self, callback: Callable[[dict[int, TransactionData]], Any]
+    ) -> None:
+        self._signal_batch_callbacks.setdefault(callback, None)
 
     @property
     def is_open(self):
@@ -8,6 +8,10 @@ class MotorControl(abc.ABC):
         self.target = 0.0
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, MotorControl):
+            return NotImplemented
         return self.index == other.index and self.target == other.target
 
 class UnknownControl(MotorControl):
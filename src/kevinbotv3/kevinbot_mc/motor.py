@@ -1,12 +1,11 @@
 import abc
 import dataclasses
+import struct
 import threading
-import time
 import uuid
 from dataclasses import field
 
 import cbor2
-import numpy as np
 import semver
 from kevinbotlib.logger import Logger
 from kevinbotlib.robot import BaseRobot
@@ -29,6 +28,27 @@ from kevinbotv3.kevinbot_mc.protocol import (
 from kevinbotv3.kevinbot_mc.signals import MotorSignals
 
 
+_F32 = struct.Struct(">f")
+
+# signal word -> (MotorSignals group, attribute)
+_SIGNAL_TABLE: dict[int, tuple[str, str]] = {
+    0x0002: ("angle", "rads"),
+    0x0003: ("velocity", "rad_s"),
+    0x0004: ("currents", "i_q"),
+    0x0005: ("currents", "i_d"),
+    0x0006: ("voltages", "v_q"),
+    0x0007: ("voltages", "v_d"),
+    0x0008: ("voltages", "v_bemf"),
+    0x0009: ("voltages", "v_in"),
+    0x000A: ("phases", "u_a"),
+    0x000B: ("phases", "u_b"),
+    0x000C: ("phases", "u_c"),
+    0x000D: ("phases", "i_a"),
+    0x000E: ("phases", "i_b"),
+    0x000F: ("phases", "i_c"),
+}
+
+
 class MotorInitializationFault(RuntimeError):
     pass
 
@@ -40,30 +60,39 @@ class KevinbotMC:
     def __init__(self, connection: AbstractMotorConnection, robot: BaseRobot):
         self.connection = connection
         self.robot = robot
-        self.connection.add_signal_callback(self.signal_handler)
+        self.connection.add_signal_batch_callback(self.signal_batch_handler)
 
         self._name = "Unknown Motor"
         self._fw_version: semver.Version | None = None
 
         self._watchdog_interval: int | None = None
         self._watchdog_thread: threading.Thread | None = None
+        # feed every half device timeout (twice per timeout window); stop() sets the event to end the feeder promptly
+        self._feed_period: float | None = None
+        self._watchdog_stop = threading.Event()
 
         self._enabled = False
 
         self._current_control = UnknownControl()
+        # copied out of _current_control so set() compares plain values, and a caller
+        # mutating a control object in place can't hide the change
+        self._current_control_index = self._current_control.index
+        self._current_control_target = self._current_control.target
 
         self._signals = MotorSignals()
 
     def _watchdog_feeder(self):
+        period = self._feed_period
         while self.connection.is_open:
             try:
                 if self._watchdog_interval:
                     resp = self.connection.execute(0x0003, EmptyTransactionData())
                     if resp.status != TransactionStatusCodes.OK:
                         Logger().warning(f"Failed to feed watchdog, got {resp.status}")
-                time.sleep(self._watchdog_interval / 2000)
             except TimeoutError as e:
                 Logger().error(f"Failed to feed watchdog: {e!r}")
+            if self._watchdog_stop.wait(period):
+                break
 
     def start(self):
 
@@ -95,16 +124,19 @@ class KevinbotMC:
                 raise MotorInitializationFault(f"Watchdog timeout transaction didn't return the correct data, expected UnsignedIntegerTransactionData, got {fw_transaction.data.value} with {fw_transaction.status}")
             Logger().debug(f"{self.name} : Device Watchdog Timeout : {watchdog_transaction.data.value}")
             self._watchdog_interval = watchdog_transaction.data.value
+            self._feed_period = self._watchdog_interval / 2000
 
             if MAX_VERSION < self._fw_version:
                 self.stop()
                 raise MotorInitializationFault(f"Motor firmware for {self.name} is higher than the maximum supported version for this library ({self._fw_version}). Either upgrade KevinbotMCLib, or downgrade this motor.")
 
             if not self._watchdog_thread or not self._watchdog_thread.is_alive():
+                self._watchdog_stop.clear()
                 self._watchdog_thread = threading.Thread(target=self._watchdog_feeder, daemon=True, name=f"KevinbotMC.Watchdog.{self.connection.name}")
                 self._watchdog_thread.start()
 
     def stop(self):
+        self._watchdog_stop.set()
         self.connection.stop()
 
     def e_stop(self):
@@ -127,29 +159,37 @@ class KevinbotMC:
         return self._enabled
 
     def set(self, control: MotorControl):
+        index = control.index
+        target = control.target
         if not self.robot.IS_SIM:
-            if not isinstance(control, type(self._current_control)):
-                control_transaction = self.connection.execute(0x0006, UnsignedIntegerTransactionData(control.index, 1))
+            mode_changed = index != self._current_control_index
+            target_changed = target != self._current_control_target
+
+            if mode_changed:
+                control_transaction = self.connection.execute(0x0006, UnsignedIntegerTransactionData(index, 1))
                 if not isinstance(control_transaction.data, UnsignedIntegerTransactionData):
                     raise MotorCommandFault(f"Control mode transaction didn't return the correct data, expected UnsignedIntegerTransactionData, got {type(control_transaction.data)}")
                 Logger().trace(f"{self.name} : New Control Mode : {control_transaction.data.value}")
 
-            if not control.target == self._current_control.target:
-                target_transaction = self.connection.execute(0x0005, FloatTransactionData(control.target))
+            if target_changed:
+                target_transaction = self.connection.execute(0x0005, FloatTransactionData(target))
                 if not isinstance(target_transaction.data, FloatTransactionData):
                     raise MotorCommandFault(f"Control target transaction didn't return the correct data, expected FloatTransactionData, got {type(target_transaction.data)}")
                 Logger().trace(f"{self.name} : New Target : {target_transaction.data.value}")
 
-            if control != self._current_control:
+            if mode_changed or target_changed:
                 apply_transaction = self.connection.execute(0x0007, EmptyTransactionData())
                 if not isinstance(apply_transaction.data, EmptyTransactionData):
                     raise MotorCommandFault(f"Control apply transaction didn't return the correct data, expected UnsignedIntegerTransactionData, got {type(apply_transaction.data)}")
         self._current_control = control
-        self.signals.target = control.target
+        self._current_control_index = index
+        self._current_control_target = target
+        self._signals.target = target
 
     def apply_config(self, key: MotorConfigurationKey, value: str | float | int):
         if isinstance(value, float):
-            value = float(np.float32(value))
+            # round to the single-precision value the controller will store
+            value = _F32.unpack(_F32.pack(value))[0]
         if not self.robot.IS_SIM:
             transaction = self.connection.execute(0x2002, PackedTransactionData({key: value}))
             if not transaction.status == TransactionStatusCodes.OK:
@@ -169,24 +209,8 @@ class KevinbotMC:
                 self.disable()
 
     def signal_handler(self, word: int, data: TransactionData):
-        handlers = {
-            0x0002: lambda v: setattr(self.signals.angle, "rads", v),
-            0x0003: lambda v: setattr(self.signals.velocity, "rad_s", v),
-            0x0004: lambda v: setattr(self.signals.currents, "i_q", v),
-            0x0005: lambda v: setattr(self.signals.currents, "i_d", v),
-            0x0006: lambda v: setattr(self.signals.voltages, "v_q", v),
-            0x0007: lambda v: setattr(self.signals.voltages, "v_d", v),
-            0x0008: lambda v: setattr(self.signals.voltages, "v_bemf", v),
-            0x0009: lambda v: setattr(self.signals.voltages, "v_in", v),
-            0x000A: lambda v: setattr(self.signals.phases, "u_a", v),
-            0x000B: lambda v: setattr(self.signals.phases, "u_b", v),
-            0x000C: lambda v: setattr(self.signals.phases, "u_c", v),
-            0x000D: lambda v: setattr(self.signals.phases, "i_a", v),
-            0x000E: lambda v: setattr(self.signals.phases, "i_b", v),
-            0x000F: lambda v: setattr(self.signals.phases, "i_c", v),
-        }
-
-        if word not in handlers:
+        entry = _SIGNAL_TABLE.get(word)
+        if entry is None:
             Logger().error(f"Unknown signal word: {word}")
             return
 
@@ -196,7 +220,12 @@ class KevinbotMC:
             )
             return
 
-        handlers[word](data.value)
+        group, attr = entry
+        setattr(getattr(self._signals, group), attr, data.value)
+
+    def signal_batch_handler(self, batch: dict[int, TransactionData]):
+        for word, data in batch.items():
+            self.signal_handler(word, data)
 
     def enable_signal(self, signal_id: int):
         transaction = self.connection.execute(0x3002, UnsignedIntegerTransactionData(signal_id, 2))
@@ -2,13 +2,38 @@ import abc
 import dataclasses
 import enum
 import struct
+from typing import ClassVar
 
 import cbor2
-import modbus_crc
 import semver
 
 MAX_VERSION = semver.Version(2025, 11, 9999)
 
+
+def _make_crc16_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _make_crc16_table()
+
+
+def crc16(data: bytes | bytearray | memoryview) -> int:
+    """CRC-16/Modbus of `data`, using one table lookup per byte.
+
+    A frame with its CRC appended low byte first yields 0.
+    """
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
 class TransactionStatusCodes(enum.IntEnum):
     OK = 0x00
     INVALID_COMMAND = 0x01
@@ -30,7 +55,7 @@ class TransactionStatusCodes(enum.IntEnum):
     NOT_IMPLEMENTED = 0x11
 
     def __str__(self):
-        return TransactionStatusCodes(super().__int__()).name
+        return self.name
 
 
 class TransactionDataType(enum.IntEnum):
@@ -46,12 +71,15 @@ class TransactionDataType(enum.IntEnum):
 
 
 class TransactionData(abc.ABC):
+    # wire data type byte sent ahead of the payload
+    TYPE_ID: ClassVar[TransactionDataType]
+
     @abc.abstractmethod
-    def generate(self) -> tuple[int, bytes]:
+    def payload(self) -> bytes:
         pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class TransactionResult:
     controlWord: int
     data: TransactionData
@@ -59,25 +87,36 @@ class TransactionResult:
 
 
 class EmptyTransactionData(TransactionData):
-    def generate(self) -> tuple[int, bytes]:
-        return 0xFF, b""
+    TYPE_ID = TransactionDataType.NULL
+
+    def payload(self) -> bytes:
+        return b""
 
 
 class FloatTransactionData(TransactionData):
+    TYPE_ID = TransactionDataType.FLOAT
+
     def __init__(self, value: float) -> None:
         self.value = value
 
-    def generate(self) -> tuple[int, bytes]:
-        return 0xFC, bytearray(struct.pack(">f", self.value))
+    def payload(self) -> bytes:
+        return struct.pack(">f", self.value)
+
+
+# largest value for each supported unsigned integer width, in bytes
+_UINT_MAX = {1: 0xFF, 2: 0xFFFF, 4: 0xFFFFFFFF}
 
 
 class UnsignedIntegerTransactionData(TransactionData):
+    TYPE_ID = TransactionDataType.UNSIGNED_INT
+
     def __init__(self, value: int, size: int) -> None:
         self.value = value
         self.size = size
 
-    def generate(self) -> tuple[int, bytes]:
-        if self.size not in (1, 2, 4):
+    def payload(self) -> bytes:
+        limit = _UINT_MAX.get(self.size)
+        if limit is None:
             # not uint8_t, uint16_t, or uint32_t
             raise ValueError(
                 "Unsigned integer transaction data size must be 1, 2, or 4 (bytes)"
@@ -88,90 +127,86 @@ class UnsignedIntegerTransactionData(TransactionData):
                 "Unsigned integer transaction data value must be non-negative"
             )
 
-        if self.size == 1 and self.value > 255:
+        if self.value > limit:
             raise ValueError(
-                "Unsigned integer transaction data value must be 255 when bytes=1"
+                f"Unsigned integer transaction data value must be {limit} when bytes={self.size}"
             )
 
-        if self.size == 2 and self.value > 65535:
-            raise ValueError(
-                "Unsigned integer transaction data value must be 65535 when bytes=2"
-            )
-
-        if self.size == 4 and self.value > 4294967295:
-            raise ValueError(
-                "Unsigned integer transaction data value must be 4294967295 when bytes=4"
-            )
-
-        # convert value into 0xF9, Big Endian
-        return 0xF9, self.value.to_bytes(self.size, "big")
+        # Big Endian
+        return self.value.to_bytes(self.size, "big")
 
     def __str__(self):
         return f"<UnsignedIntegerTransactionData(value={self.value}, size={self.size})>"
 
 
 class StringTransactionData(TransactionData):
+    TYPE_ID = TransactionDataType.STRING
+
     def __init__(self, value: str):
         self.value = value
 
-    def generate(self) -> tuple[int, bytes]:
-        return 0xF7, self.value.encode("utf-8")
+    def payload(self) -> bytes:
+        return self.value.encode("utf-8")
 
     def __str__(self):
         return f"<StringTransactionData(value={self.value})>"
 
 
 class BooleanTransactionData(TransactionData):
+    TYPE_ID = TransactionDataType.BOOLEAN
+
     def __init__(self, value: bool):
         self.value = value
 
-    def generate(self) -> tuple[int, bytes]:
-        return 0xF8, int(self.value).to_bytes(1, "big")
+    def payload(self) -> bytes:
+        return int(self.value).to_bytes(1, "big")
 
     def __str__(self):
         return f"<BooleanTransactionData(value={self.value})>"
 
 
 class PackedTransactionData(TransactionData):
+    TYPE_ID = TransactionDataType.PACKED
+
     def __init__(self, value: dict):
         self.value = value
 
-    def generate(self) -> tuple[int, bytes]:
-        b = cbor2.dumps(self.value, canonical=True)
-        return 0xF6, b
+    def payload(self) -> bytes:
+        return cbor2.dumps(self.value, canonical=True)
 
     def __str__(self):
         return f"<PackedTransactionData: {self.value}>"
 
 
+_RESPONSE_BUILDERS = {
+    TransactionDataType.UNSIGNED_INT: lambda data: UnsignedIntegerTransactionData(
+        int.from_bytes(data, "big"), len(data)
+    ),
+    TransactionDataType.PACKED: lambda data: PackedTransactionData(cbor2.loads(data)),
+    TransactionDataType.STRING: lambda data: StringTransactionData(data.decode("utf-8")),
+    TransactionDataType.BOOLEAN: lambda data: BooleanTransactionData(int.from_bytes(data, "big") == 1),
+    TransactionDataType.FLOAT: lambda data: FloatTransactionData(struct.unpack(">f", data)[0]),
+}
+
+
 def make_response_data(data_type: TransactionDataType, data: bytes):
-    match data_type:
-        case TransactionDataType.UNSIGNED_INT:
-            return UnsignedIntegerTransactionData(
-                int.from_bytes(data, "big"), len(data)
-            )
-        case TransactionDataType.PACKED:
-            return PackedTransactionData(cbor2.loads(data))
-        case TransactionDataType.STRING:
-            return StringTransactionData(data.decode("utf-8"))
-        case TransactionDataType.BOOLEAN:
-            return BooleanTransactionData(int.from_bytes(data, "big") == 1)
-        case TransactionDataType.FLOAT:
-            return FloatTransactionData(struct.unpack(">f", data)[0])
-        case _:
-            return EmptyTransactionData()
+    builder = _RESPONSE_BUILDERS.get(data_type)
+    if builder is None:
+        return EmptyTransactionData()
+    return builder(data)
+
+
+# [0x02][data_type][control_word][data_len], followed by the payload, uid and crc
+_FRAME_HEADER = struct.Struct(">BBHH")
+_FRAME_U16 = struct.Struct(">H")
 
 
 def make_transaction_data(control_word: int, data: TransactionData, uid: int) -> bytes:
-    data = data.generate()
-    data = (
-        b"\x02"
-        + data[0].to_bytes(1, "big")
-        + control_word.to_bytes(2, "big")
-        + len(data[1]).to_bytes(2, "big")
-        + data[1]
-        + uid.to_bytes(2, "big")
-    )
-    crc = bytearray(modbus_crc.crc16(data))
-    crc.reverse()
-    return data + crc
+    payload = data.payload()
+    payload_end = _FRAME_HEADER.size + len(payload)
+    frame = bytearray(payload_end + 4)
+    _FRAME_HEADER.pack_into(frame, 0, 0x02, data.TYPE_ID, control_word, len(payload))
+    frame[_FRAME_HEADER.size:payload_end] = payload
+    _FRAME_U16.pack_into(frame, payload_end, uid)
+    _FRAME_U16.pack_into(frame, payload_end + 2, crc16(memoryview(frame)[:payload_end + 2]))
+    return bytes(frame)
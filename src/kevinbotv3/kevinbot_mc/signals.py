@@ -1,27 +1,27 @@
 import dataclasses
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AngleState:
     rads: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VelocityState:
     rad_s: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CurrentState:
     i_q: float
     i_d: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VoltageState:
     v_q: float
     v_d: float
     v_bemf: float
     v_in: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PhaseStates:
     u_a: float
     u_b: float
@@ -30,7 +30,7 @@ class PhaseStates:
     i_b: float
     i_c: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MotorSignals:
     target: float = 0.0
     angle: AngleState = dataclasses.field(default_factory=lambda: AngleState(0.0))
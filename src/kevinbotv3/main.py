@@ -1,11 +1,16 @@
 import datetime
+import os
 import threading
+import time
+import tomllib
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
 
-import tomli
+import cv2
 from kevinbotlib.comm.pipeline import PipelinedCommSetter
 from kevinbotlib.comm.request import SetRequest
 from kevinbotlib.comm.sendables import (
+    BooleanSendable,
     FloatSendable,
     IntegerSendable,
     StringSendable,
@@ -31,7 +36,6 @@ from kevinbotlib.vision import (
     MjpegStreamSendable,
     VisionCommUtils,
 )
-from line_profiler import profile
 
 from kevinbotv3 import __about__
 from kevinbotv3.commands.drivebase_hold_command import DrivebaseHoldCommand
@@ -64,7 +68,38 @@ from kevinbotv3.piper import (
 from kevinbotv3.runtime import Runtime
 from kevinbotv3.settings.schema import SettingsSchema
 from kevinbotv3.tools.autoinstall import install as autoinstall_tools
-from kevinbotv3.util import apply_deadband
+from kevinbotv3.util import apply_deadband, lower_serial_latency
+
+# line-level profiling of the control loop is opt-in; otherwise the decorator is a plain identity
+if os.environ.get("KEVINBOT_PROFILE"):
+    from line_profiler import profile
+else:
+
+    def profile(func):
+        return func
+
+
+# dashboard LED swatch for each lighting effect the controller can select
+_LED_STATE_REQUESTS = {
+    effect: SetRequest("dashboard/LedState", StringSendable(value=color))
+    for effect, color in (
+        ("white", "#ffffff"),
+        ("off", "#000000"),
+        ("fire", "#ef8f11"),
+        ("rainbow", "#118fef"),
+    )
+}
+
+# dashboard floats only republish once they move by more than this
+_DASHBOARD_EPSILON = 0.01
+# unchanged dashboard values are still republished every this many ticks (1 s at the 20 ms cycle)
+_DASHBOARD_REFRESH_TICKS = 50
+
+# controller inputs polled every tick, resolved once instead of through the enum classes
+_LEFT_TRIGGER = NamedControllerAxis.LeftTrigger
+_RIGHT_TRIGGER = NamedControllerAxis.RightTrigger
+_LEFT_BUMPER = NamedControllerButtons.LeftBumper
+
 
 class RobotStateChangeCommand(Command):
     def __init__(self, state: bool, robot: BaseRobot):
@@ -89,8 +124,15 @@ class Kevinbot(BaseRobot):
 
         # Read toml settings
         with open("deploy/options.toml", "rb") as f:
-            settings = tomli.load(f)
-        self.settings = SettingsSchema(**settings)
+            settings = tomllib.load(f)
+        self.settings = SettingsSchema.model_validate(settings)
+        # read on every teleop tick
+        self._power_deadband = self.settings.kevinbot.controller.power_deadband
+        self._steer_deadband = self.settings.kevinbot.controller.steer_deadband
+        self._max_vel = self.settings.kevinbot.drive.max_vel
+        self._accel_rate = self.settings.kevinbot.controller.accel_p
+        self._brake_rate = self._accel_rate * 3.5
+        self._coast_rate = self.settings.kevinbot.controller.coast_p
 
         BaseRobot.add_basic_metrics(self, 2)
         VisionCommUtils.init_comms_types(self.comm_client)
@@ -100,16 +142,20 @@ class Kevinbot(BaseRobot):
         if self.manifest:
             self.metrics.add("kevinbot.deploy.tool-version", Metric("DeployTool Version", self.manifest.deploytool))
             self.metrics.add("kevinbot.deploy.robotname", Metric("Robot Name", self.manifest.robot))
-            time = datetime.datetime.fromtimestamp(self.manifest.timestamp, datetime.UTC).strftime(
+            deploy_time = datetime.datetime.fromtimestamp(self.manifest.timestamp, datetime.UTC).strftime(
                 "%Y-%m-%d %H:%M:%S %Z"
             )
-            self.metrics.add("kevinbot.deploy.timestamp", Metric("Deploy Time", time))
+            self.metrics.add("kevinbot.deploy.timestamp", Metric("Deploy Time", deploy_time))
             self.metrics.add("kevinbot.deploy.git.branch", Metric("Git Branch", self.manifest.git["branch"]))
             self.metrics.add("kevinbot.deploy.git.commit", Metric("Git Commit", self.manifest.git["commit"]))
             self.metrics.add("kevinbot.deploy.git.tag", Metric("Git Tag", self.manifest.git["tag"]))
 
         self.scheduler = CommandScheduler()
 
+        if not self.IS_SIM and not lower_serial_latency(self.settings.kevinbot.core.port):
+            self.telemetry.warning(
+                f"Could not lower the USB latency timer for {self.settings.kevinbot.core.port}, replies may be delayed"
+            )
         self.core = KevinbotCore(
             RawSerialInterface(
                 self,
@@ -121,6 +167,16 @@ class Kevinbot(BaseRobot):
         )
         BaseRobot.register_estop_hook(self.core.estop)
 
+        drive_config = {
+            MotorConfigurationKey.STATUS_LED_BRIGHTNESS: self.settings.kevinbot.drive.led_brightness,
+            MotorConfigurationKey.DRIVE_MAX_VOLTAGE: self.settings.kevinbot.drive.max_volts,
+            MotorConfigurationKey.FOC_MODULATION: self.settings.kevinbot.drive.modulation,
+            MotorConfigurationKey.VELOCITY_PID_P: self.settings.kevinbot.drive.kp,
+            MotorConfigurationKey.VELOCITY_PID_I: self.settings.kevinbot.drive.ki,
+            MotorConfigurationKey.VELOCITY_PID_D: self.settings.kevinbot.drive.kd,
+            MotorConfigurationKey.VELOCITY_PID_RAMP: self.settings.kevinbot.drive.kr,
+        }
+
         if not self.IS_SIM:
             self.left_drive = KevinbotMC(SerialMotorConnection(self.settings.kevinbot.drive.left.port, self.settings.kevinbot.drive.left.baud), self)
         else:
@@ -133,13 +189,8 @@ class Kevinbot(BaseRobot):
 
         self.left_drive.start()
         self.estop_hooks.append(self.left_drive.e_stop)
-        self.left_drive.apply_config(MotorConfigurationKey.STATUS_LED_BRIGHTNESS, self.settings.kevinbot.drive.led_brightness)
-        self.left_drive.apply_config(MotorConfigurationKey.DRIVE_MAX_VOLTAGE, self.settings.kevinbot.drive.max_volts)
-        self.left_drive.apply_config(MotorConfigurationKey.FOC_MODULATION, self.settings.kevinbot.drive.modulation)
-        self.left_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_P, self.settings.kevinbot.drive.kp)
-        self.left_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_I, self.settings.kevinbot.drive.ki)
-        self.left_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_D, self.settings.kevinbot.drive.kd)
-        self.left_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_RAMP, self.settings.kevinbot.drive.kr)
+        for key, value in drive_config.items():
+            self.left_drive.apply_config(key, value)
         self.left_drive.flash_save()
 
         self.left_drive.enable_signal(0x0003)
@@ -152,52 +203,97 @@ class Kevinbot(BaseRobot):
 
         self.right_drive.start()
         self.estop_hooks.append(self.right_drive.e_stop)
-        self.right_drive.apply_config(MotorConfigurationKey.STATUS_LED_BRIGHTNESS, self.settings.kevinbot.drive.led_brightness)
-        self.right_drive.apply_config(MotorConfigurationKey.DRIVE_MAX_VOLTAGE, self.settings.kevinbot.drive.max_volts)
-        self.right_drive.apply_config(MotorConfigurationKey.FOC_MODULATION, self.settings.kevinbot.drive.modulation)
-        self.right_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_P, self.settings.kevinbot.drive.kp)
-        self.right_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_I, self.settings.kevinbot.drive.ki)
-        self.right_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_D, self.settings.kevinbot.drive.kd)
-        self.right_drive.apply_config(MotorConfigurationKey.VELOCITY_PID_RAMP, self.settings.kevinbot.drive.kr)
+        for key, value in drive_config.items():
+            self.right_drive.apply_config(key, value)
         self.right_drive.flash_save()
 
         self.right_drive.enable_signal(0x0003)
         self.right_drive.enable_signal(0x0002)
 
-        self.metrics.add(
-            "kevinbot.core.linked", Metric("Core Linked", self.core.state.linked, kind=MetricType.BooleanType)
-        )
-        self.metrics.add(
-            "kevinbot.core.enabled", Metric("Core Enabled", self.core.state.enabled, kind=MetricType.BooleanType)
-        )
+        # metrics updated every tick are kept by reference and written directly
+        self._core_linked_metric = Metric("Core Linked", self.core.state.linked, kind=MetricType.BooleanType)
+        self._core_enabled_metric = Metric("Core Enabled", self.core.state.enabled, kind=MetricType.BooleanType)
+        self.metrics.add("kevinbot.core.linked", self._core_linked_metric)
+        self.metrics.add("kevinbot.core.enabled", self._core_enabled_metric)
+        self._battery_metrics: list[Metric] = []
         for batt in range(self.core.battery_count):
-            self.metrics.add(f"kevinbot.battery.{batt}.voltage", Metric(f"Battery {batt} Voltage", 0.0))
+            metric = Metric(f"Battery {batt} Voltage", 0.0)
+            self.metrics.add(f"kevinbot.battery.{batt}.voltage", metric)
+            self._battery_metrics.append(metric)
             BaseRobot.add_battery(
                 self,
                 10,
                 21,
-                partial(
-                    lambda batt: self.core.bms.voltages[batt] if len(self.core.bms.voltages) > batt - 1 else 0.0, batt
-                ),
+                partial(self._battery_voltage, batt),
             )
 
         # self.joystick = RemoteNamedController(self.comm_client, "%ControlConsole/joystick/0")
-        self.joystick = LocalNamedController(0)
+        # SDL events are drained at this rate; the default 100 Hz adds up to 10 ms of input lag on top of the tick
+        self.joystick = LocalNamedController(0, polling_hz=self.settings.kevinbot.controller.polling_hz)
         self.joystick.start_polling()
 
         self.command_joystick = CommandBasedJoystick(self.scheduler, self.joystick)
 
-        self.camera = CameraByIndex(self, 0)
-        self.camera.set_resolution(1280, 720)
-        self.pipeline = EmptyPipeline(self.camera.get_frame)
-        self.pipeline_thread = threading.Thread(target=self.vision_loop, daemon=True, name="KevinbotV3.VisionLoop")
+        # the camera is only opened when vision is enabled; otherwise no device or capture threads are set up
+        self._vision_enabled = self.settings.kevinbot.vision.enabled
+        if self._vision_enabled:
+            self.camera = CameraByIndex(self, 0)
+            self.camera.set_resolution(
+                self.settings.kevinbot.vision.capture_width, self.settings.kevinbot.vision.capture_height
+            )
+            self.pipeline = EmptyPipeline(self.camera.get_frame)
+            self.pipeline_thread = threading.Thread(target=self.vision_loop, daemon=True, name="KevinbotV3.VisionLoop")
+            self.capture_thread = threading.Thread(
+                target=self.capture_loop, daemon=True, name="KevinbotV3.CaptureLoop"
+            )
+            # single-slot handoff from capture_loop to vision_loop; a newer frame replaces one that was never encoded
+            self._latest_frame = None
+            self._frame_ready = threading.Condition()
 
         # self.tts_engine = PiperTTSEngine(self.settings.kevinbot.tts.model, self.settings.kevinbot.tts.executable)
         # self.tts = ManagedSpeaker(self.tts_engine)
 
         self.pipelined_setter = PipelinedCommSetter(self.comm_client)
+        # the setter is flushed on this worker while the scheduler iterates; see robot_periodic
+        self._comm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="KevinbotV3.CommSend")
+        self._pending_send: Future | None = None
+        # the right drive's transactions run here while the left drive's run on the robot thread
+        self._drive_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="KevinbotV3.RightDrive")
+
+        # Dashboard sendables are built once; robot_periodic updates their values each tick.
+        # The send runs on _comm_executor; robot_periodic's _wait_for_send() finishes the previous one before
+        # the shared sendables are mutated and the requests queued again.
+        self._drive_state_left = StringSendable(value="")
+        self._drive_state_right = StringSendable(value="")
+        self._drive_target_left = FloatSendable(value=0.0)
+        self._drive_target_right = FloatSendable(value=0.0)
+        self._drive_speed_left = FloatSendable(value=0.0)
+        self._drive_speed_right = FloatSendable(value=0.0)
+        self._drive_angle_left = FloatSendable(value=0.0)
+        self._drive_angle_right = FloatSendable(value=0.0)
+        self._battery = FloatSendable(value=0.0)
+        self._dashboard_requests = (
+            SetRequest("dashboard/DriveStateLeft", self._drive_state_left),
+            SetRequest("dashboard/DriveStateRight", self._drive_state_right),
+            SetRequest("dashboard/DriveTargetLeft", self._drive_target_left),
+            SetRequest("dashboard/DriveTargetRight", self._drive_target_right),
+            SetRequest("dashboard/DriveSpeedLeft", self._drive_speed_left),
+            SetRequest("dashboard/DriveSpeedRight", self._drive_speed_right),
+            SetRequest("dashboard/DriveAngleLeft", self._drive_angle_left),
+            SetRequest("dashboard/DriveAngleRight", self._drive_angle_right),
+            SetRequest("dashboard/Battery", self._battery),
+        )
+        # last value sent for each dashboard request, None until first publish
+        self._dashboard_published: list[str | float | None] = [None] * len(self._dashboard_requests)
+        self._dashboard_led_state: SetRequest | None = None
+        self._dashboard_ticks = 0
 
         self.accel_vel = 0.0
+        # drive tick per opmode, looked up once per robot_periodic instead of a string compare chain
+        self._opmode_ticks = {
+            "Teleoperated": self._teleop_periodic,
+            "AccelMode": self._accel_periodic,
+        }
 
         self.left_control: MotorControl = NeutralControl()
         self.right_control: MotorControl = NeutralControl()
@@ -210,30 +306,30 @@ class Kevinbot(BaseRobot):
         if not BaseRobot.IS_SIM:
             autoinstall_tools()
 
-        Trigger(lambda: NamedControllerButtons.LeftBumper in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.LeftBumper), self.scheduler).on_true(
             DrivebaseHoldCommand(self.core.drivebase, False)
         )
-        Trigger(lambda: NamedControllerButtons.RightBumper in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.RightBumper), self.scheduler).on_true(
             DrivebaseHoldCommand(self.core.drivebase, True)
         )
 
-        Trigger(lambda: NamedControllerButtons.A in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.A), self.scheduler).on_true(
             WhiteCommand(self.core.lighting, LightingZone.Base, lambda: Runtime.Leds.brightness)
         )
 
-        Trigger(lambda: NamedControllerButtons.B in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.B), self.scheduler).on_true(
             FireCommand(self.core.lighting, LightingZone.Base, lambda: Runtime.Leds.brightness)
         )
 
-        Trigger(lambda: NamedControllerButtons.X in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.X), self.scheduler).on_true(
             RainbowCommand(self.core.lighting, LightingZone.Base, lambda: Runtime.Leds.brightness)
         )
 
-        Trigger(lambda: NamedControllerButtons.Y in self.joystick.get_buttons(), self.scheduler).on_true(
+        Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.Y), self.scheduler).on_true(
             OffCommand(self.core.lighting, LightingZone.Base)
         )
 
-        # Trigger(lambda: NamedControllerButtons.Back in self.joystick.get_buttons(), self.scheduler).on_true(
+        # Trigger(lambda: self.joystick.get_button_state(NamedControllerButtons.Back), self.scheduler).on_true(
         #     SpeechCommand(self.tts_engine, "This is a test of local on-board Kevinbot AI speech synthesis.")
         # )
         #
@@ -251,231 +347,260 @@ class Kevinbot(BaseRobot):
 
         self.core.begin()
 
-        self.pipeline_thread.start()
+        if self._vision_enabled:
+            self.capture_thread.start()
+            self.pipeline_thread.start()
 
-        self.comm_client.set("dashboard/LedBrightness", IntegerSendable(value=Runtime.Leds.brightness))
+        self.comm_client.multi_set(
+            [
+                SetRequest("dashboard/LedBrightness", IntegerSendable(value=Runtime.Leds.brightness)),
+                SetRequest("dashboard/CameraStream", BooleanSendable(value=self._vision_enabled)),
+            ]
+        )
 
-    def vision_loop(self):
+    def capture_loop(self):
+        # keep draining the camera so the encoder always gets the newest frame instead of a buffered one
+        retry_delay = 1 / self.settings.kevinbot.vision.fps
         while True:
             ok, frame = self.pipeline.run()
-            if ok:
-                encoded = FrameEncoders.encode_jpg(frame, 50)
-                self.comm_client.multi_set(
-                    [
-                        SetRequest(
-                            "streams/camera0",
-                            MjpegStreamSendable(value=encoded, quality=50, resolution=frame.shape[:2]),
-                        ),
-                    ]
-                )
+            if not ok:
+                time.sleep(retry_delay)
+                continue
+            with self._frame_ready:
+                self._latest_frame = frame
+                self._frame_ready.notify()
+
+    def vision_loop(self):
+        # pace frames on a monotonic deadline so the encoder doesn't compete with robot_periodic for CPU
+        period = 1 / self.settings.kevinbot.vision.fps
+        next_frame = time.monotonic()
+        # the dashboard never shows the full capture, and encode time scales with pixel count
+        stream_size = (self.settings.kevinbot.vision.stream_width, self.settings.kevinbot.vision.stream_height)
+        # one sendable carries every frame; only its payload and resolution change
+        stream = MjpegStreamSendable(value=b"", quality=50, resolution=[0, 0])
+        while True:
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+                next_frame += period
+            else:
+                # running behind; don't burst frames to catch up
+                next_frame = time.monotonic() + period
+
+            with self._frame_ready:
+                if not self._frame_ready.wait_for(lambda: self._latest_frame is not None, timeout=1.0):
+                    continue
+                frame, self._latest_frame = self._latest_frame, None
+
+            # skip the encode entirely while the dashboard has the stream switched off
+            streaming = self.comm_client.get("dashboard/CameraStream", BooleanSendable)
+            if streaming and not streaming.value:
+                continue
+            if frame.shape[1] > stream_size[0] or frame.shape[0] > stream_size[1]:
+                frame = cv2.resize(frame, stream_size, interpolation=cv2.INTER_AREA)
+            stream.value = FrameEncoders.encode_jpg(frame, 50)
+            stream.resolution = frame.shape[:2]
+            self.comm_client.set("streams/camera0", stream)
 
     @profile
     def robot_periodic(self, opmode: str, enabled: bool):  # noqa: FBT001
         super().robot_periodic(opmode, enabled)
 
-        self.metrics.update("kevinbot.core.linked", self.core.state.linked)
-        self.metrics.update("kevinbot.core.enabled", self.core.state.enabled)
-        for batt in range(self.core.battery_count):
-            self.metrics.update(f"kevinbot.battery.{batt}.voltage", self.core.bms.voltages[batt])
+        # last tick's send still reads the queued sendables, so let it finish before they are touched
+        self._wait_for_send()
+
+        state = self.core.state
+        self._core_linked_metric.value = state.linked
+        self._core_enabled_metric.value = state.enabled
+        for metric, voltage in zip(self._battery_metrics, self.core.bms.voltages):
+            metric.value = voltage
 
         self.core.request_state_update(enabled)
         self.left_drive.request_state_update(enabled)
         self.right_drive.request_state_update(enabled)
 
-        if opmode == "Teleoperated":
-            # self.core.drivebase.drive_direction(
-            #     -apply_deadband(self.joystick.get_left_stick()[1], self.settings.kevinbot.controller.power_deadband),
-            #     -apply_deadband(self.joystick.get_left_stick()[0], self.settings.kevinbot.controller.steer_deadband),
-            # )
-            # self.core.drivebase.drive_direction(
-            #     -apply_deadband(self.joystick.get_triggers()[0]-self.joystick.get_triggers()[1], self.settings.kevinbot.controller.power_deadband),
-            #     -apply_deadband(self.joystick.get_left_stick()[0], self.settings.kevinbot.controller.steer_deadband),
-            # )
-            # Triggers override everything
-            if self.joystick.get_trigger_value(NamedControllerAxis.LeftTrigger) > 0.5:
-                self.left_control = CoastControl()
-                self.right_control = CoastControl()
-
-            elif (
-                self.joystick.get_trigger_value(NamedControllerAxis.RightTrigger) > 0.5
-            ):
-                self.left_control = BrakeControl()
-                self.right_control = BrakeControl()
-
-            else:
-                # Read single stick
-                raw_stick = self.joystick.get_left_stick()
-
-                throttle = apply_deadband(
-                    raw_stick[1], self.settings.kevinbot.controller.power_deadband
-                )
-                turn = -apply_deadband(
-                    raw_stick[0], self.settings.kevinbot.controller.steer_deadband
-                ) * 0.2
-
-                # Mix for single-stick (arcade) drive
-                left_cmd = throttle + turn
-                right_cmd = throttle - turn
-
-                # Scale to velocity
-                max_vel = self.settings.kevinbot.drive.max_vel
-                self.left_control = VelocityControl(left_cmd * max_vel)
-                self.right_control = VelocityControl(-(right_cmd * max_vel))
-
-            # Send to hardware
-            self.left_drive.set(self.left_control)
-            self.right_drive.set(self.right_control)
+        drive_tick = self._opmode_ticks.get(opmode)
+        if drive_tick is not None:
+            drive_tick()
+
+        # refresh the cached dashboard sendables in place
+        self._drive_state_left.value = self.core.drivebase.states[0].name
+        self._drive_state_right.value = self.core.drivebase.states[1].name
+        self._drive_target_left.value = -self.left_drive._current_control.target
+        self._drive_target_right.value = self.right_drive._current_control.target
+        self._drive_speed_left.value = -self.left_drive.signals.velocity.rad_s
+        self._drive_speed_right.value = self.right_drive.signals.velocity.rad_s
+        self._drive_angle_left.value = -self.left_drive.signals.angle.rads
+        self._drive_angle_right.value = self.right_drive.signals.angle.rads
+        self._battery.value = self.core.bms.voltages[0]
+        # self.comm_client.set("dashboard/Cpu", FloatSendable(value=SystemPerformanceData.cpu().total_usage_percent))
 
-        elif opmode == "AccelMode":
-            # --- CONFIG ---
+        # only queue values that changed, with a periodic full refresh in case the comm server lost them
+        self._dashboard_ticks += 1
+        refresh = self._dashboard_ticks >= _DASHBOARD_REFRESH_TICKS
+        if refresh:
+            self._dashboard_ticks = 0
+
+        published = self._dashboard_published
+        for index, request in enumerate(self._dashboard_requests):
+            value = request.data.value
+            last = published[index]
+            if (
+                refresh
+                or last is None
+                or (value != last if isinstance(value, str) else abs(value - last) > _DASHBOARD_EPSILON)
+            ):
+                self.pipelined_setter.add(request)
+                published[index] = value
 
-            accel_rate = self.settings.kevinbot.controller.accel_p
+        led_state = _LED_STATE_REQUESTS.get(Runtime.Leds.effect)
+        if led_state and (refresh or led_state is not self._dashboard_led_state):
+            self.pipelined_setter.add(led_state)
+            self._dashboard_led_state = led_state
 
-            brake_rate = accel_rate * 3.5
+        brightness = self.comm_client.get("dashboard/LedBrightness", IntegerSendable)
+        if brightness:
+            Runtime.Leds.brightness = brightness.value
 
-            coast_rate = self.settings.kevinbot.controller.coast_p
+        self._pending_send = self._comm_executor.submit(self.pipelined_setter.send)
+        self.scheduler.iterate()
 
-            max_vel = self.settings.kevinbot.drive.max_vel
+    def _teleop_periodic(self) -> None:
+        # self.core.drivebase.drive_direction(
+        #     -apply_deadband(self.joystick.get_left_stick()[1], self.settings.kevinbot.controller.power_deadband),
+        #     -apply_deadband(self.joystick.get_left_stick()[0], self.settings.kevinbot.controller.steer_deadband),
+        # )
+        # self.core.drivebase.drive_direction(
+        #     -apply_deadband(self.joystick.get_triggers()[0]-self.joystick.get_triggers()[1], self.settings.kevinbot.controller.power_deadband),
+        #     -apply_deadband(self.joystick.get_left_stick()[0], self.settings.kevinbot.controller.steer_deadband),
+        # )
+        # Triggers override everything
+        if self.joystick.get_trigger_value(_LEFT_TRIGGER) > 0.5:
+            self.left_control = CoastControl()
+            self.right_control = CoastControl()
 
-            # --- INPUTS ---
+        elif (
+            self.joystick.get_trigger_value(_RIGHT_TRIGGER) > 0.5
+        ):
+            self.left_control = BrakeControl()
+            self.right_control = BrakeControl()
 
-            lt = self.joystick.get_trigger_value(NamedControllerAxis.LeftTrigger)
+        else:
+            # Read single stick
+            raw_stick = self.joystick.get_left_stick()
 
-            rt = self.joystick.get_trigger_value(NamedControllerAxis.RightTrigger)
+            throttle = apply_deadband(raw_stick[1], self._power_deadband)
+            turn = -apply_deadband(raw_stick[0], self._steer_deadband) * 0.2
 
-            reverse_mode = self.joystick.get_button_state(NamedControllerButtons.LeftBumper)
+            # Mix for single-stick (arcade) drive
+            left_cmd = throttle + turn
+            right_cmd = throttle - turn
 
-            # Current velocity convention:
+            # Scale to velocity
+            max_vel = self._max_vel
+            self.left_control = VelocityControl(left_cmd * max_vel)
+            self.right_control = VelocityControl(-(right_cmd * max_vel))
 
-            #   forward = negative (e.g., -4.0 m/s)
+        # Send to hardware
+        self._set_drives()
 
-            #   reverse = positive (e.g., +4.0 m/s)
+    def _accel_periodic(self) -> None:
+        # --- CONFIG ---
 
-            # --- ACCELERATION ---
+        accel_rate = self._accel_rate
 
-            if lt > 0:
-                if reverse_mode:
-                    # Accelerate in reverse (positive)
+        brake_rate = self._brake_rate
 
-                    self.accel_vel += lt * accel_rate
+        coast_rate = self._coast_rate
 
-                else:
-                    # Accelerate forward (negative)
+        max_vel = self._max_vel
 
-                    self.accel_vel -= lt * accel_rate
+        # --- INPUTS ---
 
-            # --- BRAKE ONLY (never changes sign past zero) ---
+        lt = self.joystick.get_trigger_value(_LEFT_TRIGGER)
 
-            if rt > 0:
-                if self.accel_vel < 0:
-                    # moving forward → brake toward 0
+        rt = self.joystick.get_trigger_value(_RIGHT_TRIGGER)
 
-                    self.accel_vel = min(0.0, self.accel_vel + rt * brake_rate)
+        reverse_mode = self.joystick.get_button_state(_LEFT_BUMPER)
 
-                elif self.accel_vel > 0:
-                    # moving backward → brake toward 0
+        # Current velocity convention:
 
-                    self.accel_vel = max(0.0, self.accel_vel - rt * brake_rate)
+        #   forward = negative (e.g., -4.0 m/s)
 
-                # if exactly zero, nothing changes
+        #   reverse = positive (e.g., +4.0 m/s)
 
-            # --- NATURAL COAST (no triggers pressed) ---
+        vel = self.accel_vel
 
-            if lt == 0 and rt == 0:
-                if self.accel_vel < 0:
-                    self.accel_vel = min(0.0, self.accel_vel + coast_rate)
+        # --- ACCELERATION ---
 
-                elif self.accel_vel > 0:
-                    self.accel_vel = max(0.0, self.accel_vel - coast_rate)
+        if lt > 0:
+            # reverse accelerates positive, forward negative
+            vel += lt * accel_rate if reverse_mode else -lt * accel_rate
 
-            # --- CLAMP within max forward/reverse speeds ---
+        # --- BRAKE ONLY (never changes sign past zero) ---
 
-            self.accel_vel = max(-max_vel, min(max_vel, self.accel_vel))
+        if rt > 0:
+            vel = min(0.0, vel + rt * brake_rate) if vel < 0 else max(0.0, vel - rt * brake_rate)
 
-            # --- TURN INPUT ---
+        # --- NATURAL COAST (no triggers pressed) ---
 
-            turn = (
-                -apply_deadband(
-                    self.joystick.get_left_stick()[0],
-                    self.settings.kevinbot.controller.steer_deadband,
-                )
-                * 0.2
-            ) * self.accel_vel
+        if lt == 0 and rt == 0:
+            vel = min(0.0, vel + coast_rate) if vel < 0 else max(0.0, vel - coast_rate)
 
-            # --- MIX (arcade drive) ---
+        # --- CLAMP within max forward/reverse speeds ---
 
-            left_cmd = self.accel_vel - turn
-            right_cmd = self.accel_vel + turn
+        self.accel_vel = max(-max_vel, min(max_vel, vel))
 
-            # --- SEND COMMANDS ---
+        # --- TURN INPUT ---
 
-            self.left_control = VelocityControl(left_cmd)
+        turn = (
+            -apply_deadband(self.joystick.get_left_stick()[0], self._steer_deadband)
+            * 0.2
+        ) * self.accel_vel
 
-            self.right_control = VelocityControl(-right_cmd)
+        # --- MIX (arcade drive) ---
 
-            self.left_drive.set(self.left_control)
+        left_cmd = self.accel_vel - turn
+        right_cmd = self.accel_vel + turn
 
-            self.right_drive.set(self.right_control)
+        # --- SEND COMMANDS ---
 
-        self.pipelined_setter.extend([
-            SetRequest(
-                "dashboard/DriveStateLeft",
-                StringSendable(value=self.core.drivebase.states[0].name),
-            ),
-            SetRequest(
-                "dashboard/DriveStateRight",
-                StringSendable(value=self.core.drivebase.states[1].name),
-            ),
-            SetRequest(
-                "dashboard/DriveTargetLeft",
-                FloatSendable(value=-self.left_drive._current_control.target),
-            ),
-            SetRequest(
-                "dashboard/DriveTargetRight",
-                FloatSendable(value=self.right_drive._current_control.target),
-            ),
-            SetRequest(
-                "dashboard/DriveSpeedLeft",
-                FloatSendable(value=-self.left_drive.signals.velocity.rad_s),
-            ),
-            SetRequest(
-                "dashboard/DriveSpeedRight",
-                FloatSendable(value=self.right_drive.signals.velocity.rad_s),
-            ),
-            SetRequest(
-                "dashboard/DriveAngleLeft",
-                FloatSendable(value=-self.left_drive.signals.angle.rads),
-            ),
-            SetRequest(
-                "dashboard/DriveAngleRight",
-                FloatSendable(value=self.right_drive.signals.angle.rads),
-            ),
-            SetRequest(
-                "dashboard/Battery",
-                FloatSendable(value=self.core.bms.voltages[0]),
-            ),
-        ]
-        )
-        # self.comm_client.set("dashboard/Cpu", FloatSendable(value=SystemPerformanceData.cpu().total_usage_percent))
+        self.left_control = VelocityControl(left_cmd)
 
-        match Runtime.Leds.effect:
-            case "white":
-                self.pipelined_setter.add(SetRequest("dashboard/LedState", StringSendable(value="#ffffff")))
-            case "off":
-                self.pipelined_setter.add(SetRequest("dashboard/LedState", StringSendable(value="#000000")))
-            case "fire":
-                self.pipelined_setter.add(SetRequest("dashboard/LedState", StringSendable(value="#ef8f11")))
-            case "rainbow":
-                self.pipelined_setter.add(SetRequest("dashboard/LedState", StringSendable(value="#118fef")))
+        self.right_control = VelocityControl(-right_cmd)
 
-        brightness = self.comm_client.get("dashboard/LedBrightness", IntegerSendable)
-        if brightness:
-            Runtime.Leds.brightness = brightness.value
+        self._set_drives()
 
-        self.pipelined_setter.send()
-        self.scheduler.iterate()
+    def _set_drives(self) -> None:
+        # each drive has its own serial port, so the two sides' round-trips can overlap
+        right = self._drive_executor.submit(self.right_drive.set, self.right_control)
+        try:
+            self.left_drive.set(self.left_control)
+        except BaseException:
+            # report the left fault first; a right fault from the same tick is logged rather than replacing it
+            right_error = right.exception()
+            if right_error is not None:
+                self.telemetry.error(f"Right drive failed alongside the left drive: {right_error!r}")
+            raise
+        right.result()
+
+    def _battery_voltage(self, batt: int) -> float:
+        voltages = self.core.bms.voltages
+        return voltages[batt] if batt < len(voltages) else 0.0
+
+    def _wait_for_send(self) -> None:
+        if self._pending_send is not None:
+            pending, self._pending_send = self._pending_send, None
+            pending.result()
 
     def robot_end(self) -> None:
-        super().robot_end()
+        try:
+            self._wait_for_send()
+        finally:
+            # a failed final send must not keep the core linked
+            self._comm_executor.shutdown()
+            self._drive_executor.shutdown()
+
+            super().robot_end()
 
-        self.core.unlink()
+            self.core.unlink()
@@ -1,10 +1,10 @@
+import functools
 import json
 import os
 import subprocess
 import sys
 import threading
 from abc import ABC, abstractmethod
-from multiprocessing import Process as _Process
 from os import PathLike
 from pathlib import Path
 
@@ -15,11 +15,28 @@ from pyaudio import paInt16, PyAudio
 from kevinbotv3.audioutils import ShutupPyAudioCtxMgr
 
 
-def _abslistdir(directory):
-    dirpath: str
-    for dirpath, _, filenames in os.walk(directory):
-        for f in filenames:
-            yield os.path.abspath(os.path.join(dirpath, f))
+def _list_model_files(directory):
+    """Yield the absolute path of every .onnx file under directory, in os.walk order"""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith(".onnx") and entry.is_file():
+            yield entry.path
+    for subdir in subdirs:
+        yield from _list_model_files(subdir)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_piper_sample_rate(config_path: str) -> int:
+    """Read the output sample rate from a Piper model's .json config, cached per path"""
+    with open(config_path, "rb") as config:
+        return int(json.load(config)["audio"]["sample_rate"])
 
 
 def get_user_piper_model_dir():
@@ -32,13 +49,13 @@ def get_system_piper_model_dir():
 
 def get_piper_models_paths(user=True, system=True):  # noqa: FBT002
     if user and system:
-        return list(filter(lambda x: x.endswith(".onnx"), _abslistdir(get_user_piper_model_dir()))) + list(
-            filter(lambda x: x.endswith(".onnx"), _abslistdir(get_system_piper_model_dir()))
+        return list(_list_model_files(os.path.abspath(get_user_piper_model_dir()))) + list(
+            _list_model_files(os.path.abspath(get_system_piper_model_dir()))
         )
     if user:
-        return list(filter(lambda x: x.endswith(".onnx"), _abslistdir(get_user_piper_model_dir())))
+        return list(_list_model_files(os.path.abspath(get_user_piper_model_dir())))
     if system:
-        return list(filter(lambda x: x.endswith(".onnx"), _abslistdir(get_system_piper_model_dir())))
+        return list(_list_model_files(os.path.abspath(get_system_piper_model_dir())))
     msg = "At least one of user or system must be True"
     raise ValueError(msg)
 
@@ -66,8 +83,7 @@ class BaseTTSEngine(ABC):
         """
 
     def speak_in_background(self, text: str):
-        p = _Process(target=self.speak, args=(text,))
-        p.start()
+        threading.Thread(target=self.speak, args=(text,), daemon=True).start()
 
 
 class PiperTTSEngine(BaseTTSEngine):
@@ -86,6 +102,9 @@ class PiperTTSEngine(BaseTTSEngine):
         super().__init__()
         self.executable = str(executable)
         self._model = model
+        # model path and Piper argv, resolved on first start and reused across Piper restarts
+        self._modelfile: str | None = None
+        self._piper_argv: tuple[str, ...] = ()
         self._debug = False
         self._piper_process: subprocess.Popen | None = None
         self._stream = None
@@ -96,29 +115,28 @@ class PiperTTSEngine(BaseTTSEngine):
 
     def _start_piper(self):
         """Start the Piper process in the background and set up PyAudio stream."""
-        modelfile = get_piper_models()[self._model]
+        if self._modelfile is None:
+            self._modelfile = get_piper_models()[self._model]
+            self._piper_argv = (
+                self.executable,
+                "--model",
+                self._modelfile,
+                "--config",
+                self._modelfile + ".json",
+                "--output-raw",
+            )
+        modelfile = self._modelfile
 
         # Attempt to retrieve the bitrate
         try:
-            with open(modelfile + ".json") as config:
-                self._bitrate = int(json.loads(config.read())["audio"]["sample_rate"])
+            self._bitrate = _load_piper_sample_rate(modelfile + ".json")
         except (KeyError, json.JSONDecodeError, FileNotFoundError):
             self._bitrate = 22050
             logger.warning("Bitrate config data parsing failure. Assuming bitrate for `medium` quality (22050)")
 
-        # Set up Piper synthesis command
-        piper_command = [
-            self.executable,
-            "--model",
-            modelfile,
-            "--config",
-            modelfile + ".json",
-            "--output-raw",
-        ]
-
         # Start Piper process
         self._piper_process = subprocess.Popen(
-            piper_command,
+            self._piper_argv,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -129,14 +147,20 @@ class PiperTTSEngine(BaseTTSEngine):
         audio = PyAudio()
         self._stream = audio.open(format=paInt16, channels=1, rate=self._bitrate, output=True)
 
+        # bound here so a player left over from a restarted process can't read the new one's pipe
+        stdout = self._piper_process.stdout
+        stream = self._stream
+
         def player():
-            # Read and play audio in chunks
+            # Read and play audio in chunks; stdout is unbuffered, so each read is a single os.read
             while True:
-                data = self._piper_process.stdout.read(1024)
+                data = stdout.read(4096)
                 if not data:
-                    continue
-                self._stream.write(data)
-                self._playing = False in [b == 0 for b in data]
+                    # EOF: Piper exited, speak() will start a new process and player
+                    break
+                stream.write(data)
+                # any non-silent sample means speech is still playing
+                self._playing = any(data)
 
         threading.Thread(target=player, daemon=True).start()
 
@@ -179,6 +203,7 @@ class PiperTTSEngine(BaseTTSEngine):
             value (str): model name
         """
         self._model = value
+        self._modelfile = None
         self._cleanup()
         self._start_piper()
 
@@ -209,28 +234,54 @@ class PiperTTSEngine(BaseTTSEngine):
 
 class ManagedSpeaker:
     """
-    Manage speech so that only one string is played. Playing a new string will cancel the previous one.
+    Manage speech so that at most one string is waiting to be played. A new string replaces any string that
+    hasn't started yet; speech already handed to the engine plays to the end.
+
+    Strings are handed to a single worker thread, so the engine (and a persistent Piper process) is reused
+    instead of forking per utterance. Only the newest pending string is kept.
     """
 
     def __init__(self, engine: BaseTTSEngine) -> None:
         self.engine = engine
-        self.process: _Process | None = None
+        self._pending: str | None = None
+        self._speaking = False
+        self._ready = threading.Condition()
+        threading.Thread(target=self._worker, daemon=True, name="KevinbotV3.ManagedSpeaker").start()
+
+    def _worker(self):
+        while True:
+            with self._ready:
+                self._ready.wait_for(lambda: self._pending is not None)
+                text, self._pending = self._pending, None
+                self._speaking = True
+            try:
+                self.engine.speak(text)
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Speech failed: {e!r}")
+            finally:
+                with self._ready:
+                    self._speaking = False
 
     def speak(self, text: str):
         """
-        Stop any current speech and start a new one.
+        Queue text, replacing any string that hasn't started.
 
         Args:
             text (str): Text to synthesize
         """
-        self.cancel()
-        self.process = _Process(target=self.engine.speak, args=(text,), daemon=True)
-        self.process.start()
+        with self._ready:
+            self._pending = text
+            self._ready.notify()
 
     def cancel(self):
-        """Attempt to cancel the current speech."""
-        if self.process and self.process.is_alive():
-            self.process.terminate()
+        """Drop the pending string; speech already handed to the engine continues."""
+        with self._ready:
+            self._pending = None
 
     def running(self) -> bool:
-        return self.process.is_alive() if self.process else False
+        """Whether speech is pending, being handed to the engine, or (for engines with `playing`) still audible."""
+        with self._ready:
+            if self._speaking or self._pending is not None:
+                return True
+        # engines like Piper return from speak() once the text is queued, so ask them whether audio is still playing
+        return getattr(self.engine, "playing", False)
@@ -1,25 +1,31 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class CoreSettings(BaseModel):
+class _Settings(BaseModel):
+    # loaded once at startup and partly copied into plain attributes by the robot, so never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
+
+class CoreSettings(_Settings):
     port: str
     baud: int
     timeout: float
     tick: float
 
 
-class ControllerSettings(BaseModel):
+class ControllerSettings(_Settings):
     power_deadband: float
     steer_deadband: float
     accel_p: float
     coast_p: float
+    polling_hz: int = 250
 
 
-class DriveMotorSettings(BaseModel):
+class DriveMotorSettings(_Settings):
     port: str
     baud: int
 
-class DriveSettings(BaseModel):
+class DriveSettings(_Settings):
     max_volts: float
     max_vel: float
     led_brightness: int
@@ -32,17 +38,27 @@ class DriveSettings(BaseModel):
     right: DriveMotorSettings
 
 
-class TTSSettings(BaseModel):
+class TTSSettings(_Settings):
     model: str
     executable: str
 
 
-class KevinbotSettings(BaseModel):
+class VisionSettings(_Settings):
+    enabled: bool = True
+    capture_width: int = 1280
+    capture_height: int = 720
+    fps: float = 30.0
+    stream_width: int = 640
+    stream_height: int = 360
+
+
+class KevinbotSettings(_Settings):
     core: CoreSettings
     drive: DriveSettings
     controller: ControllerSettings
     tts: TTSSettings
+    vision: VisionSettings = VisionSettings()
 
 
-class SettingsSchema(BaseModel):
+class SettingsSchema(_Settings):
     kevinbot: KevinbotSettings
@@ -1,6 +1,25 @@
+import os
+
+
 def apply_deadband(value: float, deadband: float) -> float:
-    if abs(value) < deadband:
-        return 0.0
-    sign = 1 if value > 0 else -1
-    adjusted = (abs(value) - deadband) / (1.0 - deadband)
-    return sign * adjusted
+    if value >= deadband:
+        return (value - deadband) / (1.0 - deadband)
+    if value <= -deadband:
+        return (value + deadband) / (1.0 - deadband)
+    return 0.0
+
+
+def lower_serial_latency(port: str) -> bool:
+    """
+    Drop a USB-serial adapter's latency timer to 1 ms.
+
+    FTDI adapters default to 16 ms, holding back short replies until it expires.
+    Returns False if the port has no latency timer or it can't be written (needs root or a udev rule).
+    """
+    device = os.path.basename(os.path.realpath(port))
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{device}/latency_timer", "w") as f:
+            f.write("1")
+    except OSError:
+        return False
+    return True
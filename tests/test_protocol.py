@@ -0,0 +1,27 @@
+from kevinbotv3.kevinbot_mc.protocol import FloatTransactionData, crc16, make_transaction_data
+
+
+def test_crc16_modbus_vectors():
+    assert crc16(b"") == 0xFFFF
+    assert crc16(b"123456789") == 0x4B37
+    assert crc16(bytes.fromhex("01030000000a")) == 0xCDC5
+
+
+def test_crc16_accepts_buffer_types():
+    data = b"123456789"
+    assert crc16(bytearray(data)) == crc16(memoryview(data)) == crc16(data)
+
+
+def test_make_transaction_data_golden_frame():
+    # [0x02][FLOAT][0x0005][len 4][1.5f][uid 0x1234][crc, high byte first]
+    frame = make_transaction_data(0x0005, FloatTransactionData(1.5), 0x1234)
+    assert frame == bytes.fromhex("02fc000500043fc0000012346fd3")
+
+
+def test_received_frame_with_low_byte_first_crc_checks_to_zero():
+    # [0x01][OK][NULL][0x0005][len 0][uid 0x1234], CRC appended low byte first as the controller sends it
+    body = bytes.fromhex("0100ff000500001234")
+    crc = crc16(body)
+    frame = body + bytes((crc & 0xFF, crc >> 8))
+    assert crc16(frame) == 0
+    assert crc16(frame[:-1] + bytes((frame[-1] ^ 0x01,))) != 0